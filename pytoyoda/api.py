@@ -1,10 +1,12 @@
 """Toyota Connected Services API."""
 
 from datetime import date, datetime, timezone
+from functools import lru_cache
 from typing import Any, TypeVar
 from uuid import uuid4
 
 from loguru import logger
+from pydantic import TypeAdapter
 
 from pytoyoda.const import (
     VEHICLE_ASSOCIATION_ENDPOINT,
@@ -33,7 +35,7 @@ from pytoyoda.models.endpoints.climate import (
     ClimateSettingsResponseModel,
     ClimateStatusResponseModel,
 )
-from pytoyoda.models.endpoints.command import CommandType, RemoteCommandModel
+from pytoyoda.models.endpoints.command import CommandLiteral, RemoteCommandModel
 from pytoyoda.models.endpoints.common import StatusModel
 from pytoyoda.models.endpoints.electric import (
     ElectricCommandResponseModel,
@@ -67,6 +69,17 @@ T = TypeVar(
 )
 
 
+@lru_cache(maxsize=64)
+def _adapter(model: type) -> TypeAdapter:
+    """Return a memoized TypeAdapter for a response model.
+
+    Building a TypeAdapter per call is orders of magnitude slower than
+    reusing one; caching keeps a single adapter per model class so raw
+    response bytes can be validated in one pydantic-core pass.
+    """
+    return TypeAdapter(model)
+
+
 class Api:
     """API for Toyota Connected Services.
 
@@ -103,10 +116,18 @@ class Api:
             Parsed response data as specified model instance
 
         """
-        response = await self.controller.request_json(
+        response = await self.controller.request_raw(
             method=method, endpoint=endpoint, **kwargs
         )
-        parsed_response = model(**response)
+        # Feed the raw bytes straight to pydantic-core: decode and
+        # validation happen in one Rust-side pass without materializing an
+        # intermediate Python dict.
+        adapter = _adapter(model)
+        parsed_response = (
+            adapter.validate_json(response.content)
+            if response.content
+            else adapter.validate_python({})
+        )
         logger.debug(f"Parsed '{model.__name__}': {parsed_response}")
         return parsed_response
 
@@ -473,7 +494,7 @@ class Api:
     # Remote Commands
 
     async def send_command(
-        self, vin: str, command: CommandType, beeps: int = 0
+        self, vin: str, command: CommandLiteral, beeps: int = 0
     ) -> StatusModel:
         """Send a remote command to a vehicle.
 
@@ -3,13 +3,19 @@
 from datetime import timedelta
 from typing import Any, TypeVar
 
-from pydantic import computed_field
+from pydantic import ConfigDict, PrivateAttr, computed_field
 
-from pytoyoda.const import KILOMETERS_UNIT, MILES_UNIT
+from pytoyoda.const import (
+    KILOMETERS_UNIT,
+    KM_TO_MILES_FACTOR,
+    MILES_TO_KM_FACTOR,
+    MILES_UNIT,
+)
 from pytoyoda.models.endpoints.electric import (
     ChargingSchedule,
     ElectricResponseModel,
     ElectricStatusModel,
+    _minutes_to_td,
 )
 from pytoyoda.models.endpoints.telemetry import TelemetryModel, TelemetryResponseModel
 from pytoyoda.models.endpoints.vehicle_health import (
@@ -17,7 +23,7 @@ from pytoyoda.models.endpoints.vehicle_health import (
     VehicleHealthResponseModel,
 )
 from pytoyoda.utils.conversions import convert_distance
-from pytoyoda.utils.models import CustomAPIBaseModel, Distance
+from pytoyoda.utils.models import CustomAPIBaseModel, Distance, cached_computed
 
 T = TypeVar(
     "T",
@@ -31,6 +37,17 @@ T = TypeVar(
 class Dashboard(CustomAPIBaseModel[type[T]]):
     """Information that may be found on a vehicles dashboard."""
 
+    # Declared private attributes live in __pydantic_private__ instead of
+    # falling back to the instance __dict__; frozen because a Dashboard is
+    # an immutable snapshot of its endpoint responses.
+    model_config = ConfigDict(arbitrary_types_allowed=True, frozen=True)
+
+    _electric: ElectricStatusModel | None = PrivateAttr(default=None)
+    _telemetry: TelemetryModel | None = PrivateAttr(default=None)
+    _health: VehicleHealthModel | None = PrivateAttr(default=None)
+    _distance_unit: str = PrivateAttr(default=KILOMETERS_UNIT)
+    _unit_factors: dict[str, float] = PrivateAttr(default_factory=dict)
+
     def __init__(
         self,
         telemetry: TelemetryResponseModel | None = None,
@@ -58,17 +75,43 @@ class Dashboard(CustomAPIBaseModel[type[T]]):
         }
         super().__init__(data=data, **kwargs)  # type: ignore[reportArgumentType, arg-type]
 
-        self._electric: ElectricStatusModel | None = (
-            electric.payload if electric else None
-        )
-        self._telemetry: TelemetryModel | None = (
-            telemetry.payload if telemetry else None
-        )
-        self._health: VehicleHealthModel | None = health.payload if health else None
-        self._distance_unit: str = KILOMETERS_UNIT if metric else MILES_UNIT
+        self._electric = electric.payload if electric else None
+        self._telemetry = telemetry.payload if telemetry else None
+        self._health = health.payload if health else None
+        self._distance_unit = KILOMETERS_UNIT if metric else MILES_UNIT
+
+        # Conversion factors from a measurement's source unit to the selected
+        # unit, fixed for the life of the Dashboard. Turns the common case in
+        # _convert_or_none into a dict lookup plus one multiplication.
+        self._unit_factors = {
+            KILOMETERS_UNIT: 1.0 if metric else KM_TO_MILES_FACTOR,
+            MILES_UNIT: MILES_TO_KM_FACTOR if metric else 1.0,
+        }
+
+    def _convert_or_none(self, measurement: Any) -> float | None:  # noqa : ANN401
+        """Convert a unit/value measurement to the selected distance unit.
+
+        Args:
+            measurement: Object with unit and value attributes, or None
+
+        Returns:
+            Converted distance, or None if the measurement is incomplete
+
+        """
+        if measurement is None or measurement.unit is None or measurement.value is None:
+            return None
+
+        factor = self._unit_factors.get(measurement.unit)
+        if factor is None:
+            # Unknown source unit - fall back to the generic conversion
+            return convert_distance(
+                self._distance_unit, measurement.unit, measurement.value
+            )
+        return round(measurement.value * factor, 3)
 
     @computed_field  # type: ignore[prop-decorator]
     @property
+    @cached_computed
     def odometer(self) -> float | None:
         """Odometer distance.
 
@@ -78,18 +121,11 @@ class Dashboard(CustomAPIBaseModel[type[T]]):
         if self._telemetry is None:
             return None
 
-        odometer = self._telemetry.odometer
-        if odometer is None or odometer.unit is None or odometer.value is None:
-            return None
-
-        return convert_distance(
-            self._distance_unit,
-            odometer.unit,
-            odometer.value,
-        )
+        return self._convert_or_none(self._telemetry.odometer)
 
     @computed_field  # type: ignore[prop-decorator]
     @property
+    @cached_computed
     def odometer_with_unit(self) -> Distance | None:
         """Odometer distance with unit.
 
@@ -130,6 +166,7 @@ class Dashboard(CustomAPIBaseModel[type[T]]):
 
     @computed_field  # type: ignore[prop-decorator]
     @property
+    @cached_computed
     def fuel_range(self) -> float | None:
         """The range using _only_ fuel.
 
@@ -138,34 +175,22 @@ class Dashboard(CustomAPIBaseModel[type[T]]):
                 If vehicle is electric returns 0
                 If vehicle doesn't support fuel range returns None
         """
-        if self._electric is not None and self._electric.fuel_range is not None:
-            fuel_range = self._electric.fuel_range
-
-            if fuel_range.unit is not None and fuel_range.value is not None:
-                return convert_distance(
-                    self._distance_unit,
-                    fuel_range.unit,
-                    fuel_range.value,
-                )
+        if self._electric is not None:
+            value = self._convert_or_none(self._electric.fuel_range)
+            if value is not None:
+                return value
 
         if (
             self._telemetry is not None
-            and self._telemetry.distance_to_empty is not None
-            and self._telemetry.distance_to_empty.unit is not None
-            and self._telemetry.distance_to_empty.value is not None
             and self._telemetry.battery_level is None  # fuel-only vehicles only
         ):
-            dte = self._telemetry.distance_to_empty
-            return convert_distance(
-                self._distance_unit,
-                dte.unit,
-                dte.value,
-            )
+            return self._convert_or_none(self._telemetry.distance_to_empty)
 
         return None
 
     @computed_field  # type: ignore[prop-decorator]
     @property
+    @cached_computed
     def fuel_range_with_unit(self) -> Distance | None:
         """The range using _only_ fuel with unit.
 
@@ -179,6 +204,7 @@ class Dashboard(CustomAPIBaseModel[type[T]]):
 
     @computed_field  # type: ignore[prop-decorator]
     @property
+    @cached_computed
     def battery_range(self) -> float | None:
         """The range using _only_ EV.
 
@@ -188,35 +214,20 @@ class Dashboard(CustomAPIBaseModel[type[T]]):
                 If vehicle doesn't support battery range returns None
         """
         # Prefer explicit EV range from the electric endpoint
-        if self._electric is not None and self._electric.ev_range is not None:
-            ev_range = self._electric.ev_range
-
-            if ev_range.unit is not None and ev_range.value is not None:
-                return convert_distance(
-                    self._distance_unit,
-                    ev_range.unit,
-                    ev_range.value,
-                )
+        if self._electric is not None:
+            value = self._convert_or_none(self._electric.ev_range)
+            if value is not None:
+                return value
 
         # Fallback to telemetry when EV info is missing
-        if (
-            self._telemetry is not None
-            and self._telemetry.battery_level is not None
-            and self._telemetry.distance_to_empty is not None
-            and self._telemetry.distance_to_empty.unit is not None
-            and self._telemetry.distance_to_empty.value is not None
-        ):
-            dte = self._telemetry.distance_to_empty
-            return convert_distance(
-                self._distance_unit,
-                dte.unit,
-                dte.value,
-            )
+        if self._telemetry is not None and self._telemetry.battery_level is not None:
+            return self._convert_or_none(self._telemetry.distance_to_empty)
 
         return None
 
     @computed_field  # type: ignore[prop-decorator]
     @property
+    @cached_computed
     def battery_range_with_unit(self) -> Distance | None:
         """The range using _only_ EV with unit.
 
@@ -230,6 +241,7 @@ class Dashboard(CustomAPIBaseModel[type[T]]):
 
     @computed_field  # type: ignore[prop-decorator]
     @property
+    @cached_computed
     def battery_range_with_ac(self) -> float | None:
         """The range using _only_ EV when using AC.
 
@@ -238,21 +250,14 @@ class Dashboard(CustomAPIBaseModel[type[T]]):
                 If vehicle is fuel only returns 0
                 If vehicle doesn't support battery range returns 0
         """
-        if self._electric is None or self._electric.ev_range_with_ac is None:
-            return None
-
-        ev_ac = self._electric.ev_range_with_ac
-        if ev_ac.unit is None or ev_ac.value is None:
+        if self._electric is None:
             return None
 
-        return convert_distance(
-            self._distance_unit,
-            ev_ac.unit,
-            ev_ac.value,
-        )
+        return self._convert_or_none(self._electric.ev_range_with_ac)
 
     @computed_field  # type: ignore[prop-decorator]
     @property
+    @cached_computed
     def battery_range_with_ac_with_unit(self) -> Distance | None:
         """The range using _only_ EV when using AC with unit.
 
@@ -266,6 +271,7 @@ class Dashboard(CustomAPIBaseModel[type[T]]):
 
     @computed_field  # type: ignore[prop-decorator]
     @property
+    @cached_computed
     def range(self) -> float | None:
         """The range using all available fuel & EV.
 
@@ -276,23 +282,14 @@ class Dashboard(CustomAPIBaseModel[type[T]]):
                 hybrid == fuel_range + battery_range_with_ac
                 None if not supported
         """
-        if (
-            self._telemetry is not None
-            and self._telemetry.distance_to_empty is not None
-            and self._telemetry.distance_to_empty.unit is not None
-            and self._telemetry.distance_to_empty.value is not None
-        ):
-            dte = self._telemetry.distance_to_empty
-            return convert_distance(
-                self._distance_unit,
-                dte.unit,
-                dte.value,
-            )
+        if self._telemetry is None:
+            return None
 
-        return None
+        return self._convert_or_none(self._telemetry.distance_to_empty)
 
     @computed_field  # type: ignore[prop-decorator]
     @property
+    @cached_computed
     def range_with_unit(self) -> Distance | None:
         """The range using all available fuel & EV with unit.
 
@@ -329,11 +326,8 @@ class Dashboard(CustomAPIBaseModel[type[T]]):
         if self._electric is None:
             return None
 
-        if (rct := self._electric.remaining_charge_time) is None:
-            return None
-
         # 0 minutes is a valid value (e.g. "finishing up now")
-        return timedelta(minutes=rct)
+        return _minutes_to_td(self._electric.remaining_charge_time)
 
     @computed_field  # type: ignore[prop-decorator]
     @property
@@ -349,6 +343,6 @@ class Dashboard(CustomAPIBaseModel[type[T]]):
 
     @computed_field  # type: ignore[prop-decorator]
     @property
-    def charging_schedules(self) -> list[ChargingSchedule] | None:
+    def charging_schedules(self) -> tuple[ChargingSchedule, ...] | None:
         """Return charging schedules as parsed from the electric endpoint."""
         return self._electric.charging_schedules if self._electric else None
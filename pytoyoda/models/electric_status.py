@@ -12,9 +12,10 @@ from pytoyoda.models.endpoints.electric import (
     ElectricStatusModel,
     NextChargingEvent,
     ScheduledChargeWindow,
+    _local_now,
 )
 from pytoyoda.utils.conversions import convert_distance
-from pytoyoda.utils.models import CustomAPIBaseModel, Distance
+from pytoyoda.utils.models import CustomAPIBaseModel, Distance, cached_computed
 
 T = TypeVar(
     "T",
@@ -25,6 +26,17 @@ T = TypeVar(
 class ElectricStatus(CustomAPIBaseModel[type[T]]):
     """ElectricStatus."""
 
+    # Plain forwarders of payload attributes are real fields snapshotted in
+    # __init__ rather than computed_fields: pydantic-core then serializes
+    # them on its fast attribute path instead of invoking a Python property
+    # getter on every model_dump.
+    battery_level: float | None = None
+    charging_status: str | None = None
+    remaining_charge_time: int | None = None
+    can_set_next_charging_event: bool | None = None
+    last_update_timestamp: datetime | None = None
+    next_charging_event: NextChargingEvent | None = None
+
     def __init__(
         self,
         electric_status: ElectricResponseModel | None = None,
@@ -39,12 +51,10 @@ class ElectricStatus(CustomAPIBaseModel[type[T]]):
             **kwargs: Additional keyword arguments passed to the parent class
 
         """
-        # Create temporary object for data
-        data = {
-            "electric_status": electric_status,
-            "metric": metric,
-        }
-        super().__init__(data=data, **kwargs)  # type: ignore[reportArgumentType, arg-type]
+        # The response model itself is the underlying data object; skipping
+        # the old wrapper dict saves an allocation per construction, and a
+        # Dashboard refresh builds many of these wrappers.
+        super().__init__(data=electric_status, **kwargs)  # type: ignore[reportArgumentType, arg-type]
 
         # Get payload data from models
         self._electric_status: ElectricStatusModel | None = (
@@ -52,52 +62,36 @@ class ElectricStatus(CustomAPIBaseModel[type[T]]):
         )
         self._distance_unit: str = KILOMETERS_UNIT if metric else MILES_UNIT
 
-    @computed_field  # type: ignore[prop-decorator]
-    @property
-    def battery_level(self) -> float | None:
-        """Battery level of the vehicle.
-
-        Returns:
-            float: Battery level of the vehicle in percentage.
-
-        """
-        return self._electric_status.battery_level if self._electric_status else None
-
-    @computed_field  # type: ignore[prop-decorator]
-    @property
-    def charging_status(self) -> str | None:
-        """Charging status of the vehicle.
-
-        Returns:
-            str: Charging status of the vehicle.
-
-        """
-        return self._electric_status.charging_status if self._electric_status else None
-
-    @computed_field  # type: ignore[prop-decorator]
-    @property
-    def remaining_charge_time(self) -> int | None:
-        """Remaining time to full charge in minutes.
-
-        Returns:
-            int: Remaining time to full charge in minutes.
-
+        if (es := self._electric_status) is not None:
+            self.battery_level = es.battery_level
+            self.charging_status = es.charging_status
+            self.remaining_charge_time = es.remaining_charge_time
+            self.can_set_next_charging_event = es.can_set_next_charging_event
+            self.last_update_timestamp = es.last_update_timestamp
+            self.next_charging_event = es.next_charging_event
+
+    def __setattr__(self, name: str, value: object) -> None:
+        """Keep ``_has_status`` in sync with ``_electric_status``.
+
+        The ~10 computed fields evaluated on every ``model_dump()`` test a
+        plain precomputed bool instead of dispatching truthiness through a
+        pydantic-managed attribute each time. Recomputing it on assignment
+        keeps the flag correct when the payload is swapped after init.
         """
-        return (
-            self._electric_status.remaining_charge_time
-            if self._electric_status
-            else None
-        )
+        super().__setattr__(name, value)
+        if name == "_electric_status":
+            super().__setattr__("_has_status", value is not None)
 
     @computed_field  # type: ignore[prop-decorator]
     @property
+    @cached_computed
     def ev_range(self) -> float | None:
         """Electric vehicle range.
 
         Returns:
             float: Electric vehicle range in the current selected units.
         """
-        if not self._electric_status:
+        if not self._has_status:
             return None
 
         ev = self._electric_status.ev_range
@@ -108,6 +102,10 @@ class ElectricStatus(CustomAPIBaseModel[type[T]]):
         if ev.value is None or ev.unit is None:
             return None
 
+        # Common case: API already reports in the selected unit
+        if ev.unit == self._distance_unit:
+            return ev.value
+
         return convert_distance(
             self._distance_unit,
             ev.unit,
@@ -116,6 +114,7 @@ class ElectricStatus(CustomAPIBaseModel[type[T]]):
 
     @computed_field  # type: ignore[prop-decorator]
     @property
+    @cached_computed
     def ev_range_with_unit(self) -> Distance | None:
         """Electric vehicle range with unit.
 
@@ -130,6 +129,7 @@ class ElectricStatus(CustomAPIBaseModel[type[T]]):
 
     @computed_field  # type: ignore[prop-decorator]
     @property
+    @cached_computed
     def ev_range_with_ac(self) -> float | None:
         """Electric vehicle range with AC.
 
@@ -137,7 +137,7 @@ class ElectricStatus(CustomAPIBaseModel[type[T]]):
             float: Electric vehicle range with AC in the
                 current selected units.
         """
-        if self._electric_status is None:
+        if not self._has_status:
             return None
 
         if (ev_ac := self._electric_status.ev_range_with_ac) is None:
@@ -147,6 +147,10 @@ class ElectricStatus(CustomAPIBaseModel[type[T]]):
         if ev_ac.unit is None or ev_ac.value is None:
             return None
 
+        # Common case: API already reports in the selected unit
+        if ev_ac.unit == self._distance_unit:
+            return ev_ac.value
+
         return convert_distance(
             self._distance_unit,
             ev_ac.unit,
@@ -155,6 +159,7 @@ class ElectricStatus(CustomAPIBaseModel[type[T]]):
 
     @computed_field  # type: ignore[prop-decorator]
     @property
+    @cached_computed
     def ev_range_with_ac_with_unit(self) -> Distance | None:
         """Electric vehicle range with AC with unit.
 
@@ -169,57 +174,13 @@ class ElectricStatus(CustomAPIBaseModel[type[T]]):
 
     @computed_field  # type: ignore[prop-decorator]
     @property
-    def can_set_next_charging_event(self) -> bool | None:
-        """Can set next charging event.
-
-        Returns:
-            bool: Can set next charging event.
-
-        """
-        return (
-            self._electric_status.can_set_next_charging_event
-            if self._electric_status
-            else None
-        )
-
-    @computed_field  # type: ignore[prop-decorator]
-    @property
-    def last_update_timestamp(self) -> datetime | None:
-        """Last update timestamp.
-
-        Returns:
-            datetime: Last update timestamp.
-        """
-        return (
-            self._electric_status.last_update_timestamp
-            if self._electric_status
-            else None
-        )
-
-    @computed_field
-    @property
-    def next_charging_event(self) -> NextChargingEvent | None:
-        """Next scheduled charging event.
-
-        Returns:
-            NextChargingEvent: The current active next charging event
-
-        """
-        return (
-            self._electric_status.next_charging_event if self._electric_status else None
-        )
-
-    @computed_field  # type: ignore[prop-decorator]
-    @property
-    def charging_schedules(self) -> list[ChargingSchedule] | None:
+    def charging_schedules(self) -> tuple[ChargingSchedule, ...] | None:
         """Charging schedules returned by the API.
 
         Returns:
-            list[ChargingSchedule]: List of charging schedules or None
+            tuple[ChargingSchedule, ...]: Charging schedules or None
         """
-        return (
-            self._electric_status.charging_schedules if self._electric_status else None
-        )
+        return self._electric_status.charging_schedules if self._has_status else None
 
     @computed_field  # type: ignore[prop-decorator]
     @property
@@ -246,25 +207,9 @@ class ElectricStatus(CustomAPIBaseModel[type[T]]):
         if not self.has_active_charging_schedule:
             return None
 
-        now = datetime.now().astimezone()
-
-        def _next_window_for_schedule(
-            sched: ChargingSchedule,
-        ) -> ScheduledChargeWindow | None:
-            if not sched.enabled:
-                return None
-            try:
-                return sched.next_occurrence(ref=now)
-            except (ValueError, TypeError, AttributeError):
-                return None
-
-        windows = [
-            w
-            for s in (self.charging_schedules or [])
-            for w in (_next_window_for_schedule(s),)
-            if w
-        ]
-        if not windows:
+        # Integer ranking in next_global_window allocates a window only for
+        # the winning schedule instead of one per schedule plus min().
+        try:
+            return self._electric_status.next_global_window(ref=_local_now())
+        except (ValueError, TypeError, AttributeError):
             return None
-
-        return min(windows, key=lambda w: w.start)
@@ -12,57 +12,53 @@ from pytoyoda.utils.models import CustomEndpointBaseModel
 class _TermsActivityModel(CustomEndpointBaseModel):
     """Model for terms and conditions activity."""
 
-    time_stamp: datetime | None = Field(alias="timeStamp")
+    time_stamp: datetime | None
     version: str | None
 
 
 class _AdditionalAttributesModel(CustomEndpointBaseModel):
     """Model for additional account attributes."""
 
-    is_terms_accepted: bool | None = Field(alias="isTermsAccepted")
-    terms_activity: list[_TermsActivityModel] | None = Field(
-        alias="termsActivity", default=None
-    )
+    is_terms_accepted: bool | None
+    terms_activity: list[_TermsActivityModel] | None = None
 
 
 class _EmailModel(CustomEndpointBaseModel):
-    email_address: str | None = Field(alias="emailAddress")
-    email_type: str | None = Field(alias="emailType")
-    email_verified: bool | None = Field(alias="emailVerified")
-    verification_date: datetime | None = Field(alias="verificationDate")
+    email_address: str | None
+    email_type: str | None
+    email_verified: bool | None
+    verification_date: datetime | None
 
 
 class _PhoneNumberModel(CustomEndpointBaseModel):
     """Model for phone number information."""
 
-    country_code: int | None = Field(alias="countryCode")
-    phone_number: int | None = Field(alias="phoneNumber")
-    phone_verified: bool | None = Field(alias="phoneVerified")
-    verification_date: datetime | None = Field(alias="verificationDate")
+    country_code: int | None
+    phone_number: int | None
+    phone_verified: bool | None
+    verification_date: datetime | None
 
 
 class _CustomerModel(CustomEndpointBaseModel):
     """Model for customer information."""
 
-    account_status: str | None = Field(alias="accountStatus")
-    additional_attributes: _AdditionalAttributesModel | None = Field(
-        alias="additionalAttributes"
-    )
-    create_date: datetime | None = Field(alias="createDate")
-    create_source: str | None = Field(alias="createSource")
-    customer_type: str | None = Field(alias="customerType")
+    account_status: str | None
+    additional_attributes: _AdditionalAttributesModel | None
+    create_date: datetime | None
+    create_source: str | None
+    customer_type: str | None
     emails: list[_EmailModel] | None
-    first_name: str | None = Field(alias="firstName")
+    first_name: str | None
     forge_rock_id: UUID | None = Field(alias="forgerockId")
     guid: UUID | None
-    is_cp_migrated: bool | None = Field(alias="isCpMigrated")
-    last_name: str | None = Field(alias="lastName")
-    last_update_date: datetime | None = Field(alias="lastUpdateDate")
-    last_update_source: str | None = Field(alias="lastUpdateSource")
-    phone_numbers: list[_PhoneNumberModel] | None = Field(alias="phoneNumbers")
-    preferred_language: str | None = Field(alias="preferredLanguage")
-    signup_type: str | None = Field(alias="signupType")
-    ui_language: str | None = Field(alias="uiLanguage")
+    is_cp_migrated: bool | None
+    last_name: str | None
+    last_update_date: datetime | None
+    last_update_source: str | None
+    phone_numbers: list[_PhoneNumberModel] | None
+    preferred_language: str | None
+    signup_type: str | None
+    ui_language: str | None
 
 
 class AccountModel(CustomEndpointBaseModel):
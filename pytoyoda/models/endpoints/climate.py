@@ -1,11 +1,13 @@
 """Toyota Connected Services API - Climate Models."""
 
+from dataclasses import dataclass
 from datetime import datetime
+from typing import Annotated
 
-from pydantic import Field
+from pydantic import ConfigDict, Field
 
 from pytoyoda.models.endpoints.common import StatusModel, UnitValueModel
-from pytoyoda.utils.models import CustomEndpointBaseModel
+from pytoyoda.utils.models import ApiDatetime, CustomEndpointBaseModel
 
 
 class ACParameters(CustomEndpointBaseModel):
@@ -21,9 +23,9 @@ class ACParameters(CustomEndpointBaseModel):
     """
 
     available: bool | None = None
-    display_name: str | None = Field(alias="displayName", default=None)
+    display_name: str | None = None
     enabled: bool = False
-    icon_url: str | None = Field(alias="iconUrl", default=None)
+    icon_url: str | None = None
     name: str
 
 
@@ -39,11 +41,9 @@ class ACOperations(CustomEndpointBaseModel):
     """
 
     available: bool | None = None
-    category_display_name: str | None = Field(alias="categoryDisplayName", default=None)
-    category_name: str = Field(alias="categoryName")
-    ac_parameters: list[ACParameters] = Field(
-        alias="acParameters", default_factory=list
-    )
+    category_display_name: str | None = None
+    category_name: str
+    ac_parameters: list[ACParameters] = Field(default_factory=list)
 
 
 class ClimateSettingsModel(CustomEndpointBaseModel):
@@ -60,28 +60,40 @@ class ClimateSettingsModel(CustomEndpointBaseModel):
 
     """
 
-    ac_operations: list[ACOperations] | None = Field(alias="acOperations", default=None)
-    max_temp: float | None = Field(alias="maxTemp", default=None)
-    min_temp: float | None = Field(alias="minTemp", default=None)
-    settings_on: bool = Field(alias="settingsOn")
-    temp_interval: float | None = Field(alias="tempInterval", default=None)
+    ac_operations: list[ACOperations] | None = None
+    max_temp: float | None = None
+    min_temp: float | None = None
+    settings_on: bool
+    temp_interval: float | None = None
     temperature: float
-    temperature_unit: str = Field(alias="temperatureUnit")
+    temperature_unit: str
 
 
-class CurrentTemperature(UnitValueModel):
-    """Model representing current temperature.
+# The leaf types below hold plain data with no validation logic, so they are
+# slotted dataclasses instead of BaseModels: pydantic's dataclass schema
+# constructs them noticeably faster, which matters for the temperature ticks
+# a streaming UI pulls several times per minute.
+
+
+@dataclass(slots=True, frozen=True)
+class CurrentTemperature:
+    """The currently measured temperature.
 
     Attributes:
         timestamp: When the temperature was recorded
+        unit: The unit of measurement (e.g., "C", "F")
+        value: The measured temperature
 
     """
 
     timestamp: datetime
+    unit: str | None = None
+    value: float | None = None
 
 
-class ClimateOptions(CustomEndpointBaseModel):
-    """Model representing climate options.
+@dataclass(slots=True, frozen=True)
+class ClimateOptions:
+    """Additional climate options.
 
     Attributes:
         front_defogger: Whether front defogger is active
@@ -89,8 +101,10 @@ class ClimateOptions(CustomEndpointBaseModel):
 
     """
 
-    front_defogger: bool = Field(alias="frontDefogger")
-    rear_defogger: bool = Field(alias="rearDefogger")
+    __pydantic_config__ = ConfigDict(populate_by_name=True)
+
+    front_defogger: Annotated[bool, Field(alias="frontDefogger")]
+    rear_defogger: Annotated[bool, Field(alias="rearDefogger")]
 
 
 class ClimateStatusModel(CustomEndpointBaseModel):
@@ -107,28 +121,27 @@ class ClimateStatusModel(CustomEndpointBaseModel):
 
     """
 
-    current_temperature: CurrentTemperature | None = Field(
-        alias="currentTemperature", default=None
-    )
+    current_temperature: CurrentTemperature | None = None
     duration: int | None = None
     options: ClimateOptions | None = None
-    started_at: datetime | None = Field(alias="startedAt", default=None)
+    started_at: ApiDatetime | None = None
     status: bool
-    target_temperature: UnitValueModel | None = Field(
-        alias="targetTemperature", default=None
-    )
+    target_temperature: UnitValueModel | None = None
     type: str
 
 
-class RemoteHVACModel(CustomEndpointBaseModel):
-    """Model representing remote HVAC settings.
+@dataclass(slots=True, frozen=True)
+class RemoteHVACModel:
+    """Remote HVAC settings.
 
     Attributes:
         engine_start_time: Time in minutes for engine to run
 
     """
 
-    engine_start_time: int = Field(alias="engineStartTime")
+    __pydantic_config__ = ConfigDict(populate_by_name=True)
+
+    engine_start_time: Annotated[int, Field(alias="engineStartTime")]
 
 
 class ClimateControlModel(CustomEndpointBaseModel):
@@ -141,7 +154,7 @@ class ClimateControlModel(CustomEndpointBaseModel):
     """
 
     command: str
-    remote_hvac: RemoteHVACModel | None = Field(alias="remoteHvac", default=None)
+    remote_hvac: RemoteHVACModel | None = None
 
 
 class ClimateSettingsResponseModel(StatusModel):
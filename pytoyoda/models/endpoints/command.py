@@ -1,35 +1,57 @@
 """Toyota Connected Services API - Remote Commands Models."""
 
-from enum import Enum
-
-from pydantic import ConfigDict, Field
+from typing import Final, Literal
 
 from pytoyoda.utils.models import CustomEndpointBaseModel
 
+CommandLiteral = Literal[
+    "door-lock",
+    "door-unlock",
+    "engine-start",
+    "engine-stop",
+    "hazard-on",
+    "hazard-off",
+    "power-window-on",
+    "power-window-off",
+    "ac-settings-on",
+    "sound-horn",
+    "buzzer-warning",
+    "find-vehicle",
+    "ventilation-on",
+    "trunk-lock",
+    "trunk-unlock",
+    "headlight-on",
+    "headlight-off",
+]
+
 
-class CommandType(str, Enum):
+class CommandType:
     """List of possible remote commands.
 
     Each value represents a specific command that can be sent to the vehicle.
+    Plain string constants rather than an Enum: the command field is a
+    Literal, which pydantic-core validates with a compiled hash set instead
+    of iterating enum members, and the old use_enum_values config discarded
+    the Enum instance anyway.
     """
 
-    DOOR_LOCK = "door-lock"
-    DOOR_UNLOCK = "door-unlock"
-    ENGINE_START = "engine-start"
-    ENGINE_STOP = "engine-stop"
-    HAZARD_ON = "hazard-on"
-    HAZARD_OFF = "hazard-off"
-    WINDOW_ON = "power-window-on"
-    WINDOW_OFF = "power-window-off"
-    AC_SETTINGS_ON = "ac-settings-on"
-    SOUND_HORN = "sound-horn"
-    BUZZER_WARNING = "buzzer-warning"
-    FIND_VEHICLE = "find-vehicle"
-    VENTILATION_ON = "ventilation-on"
-    TRUNK_LOCK = "trunk-lock"
-    TRUNK_UNLOCK = "trunk-unlock"
-    HEADLIGHT_ON = "headlight-on"
-    HEADLIGHT_OFF = "headlight-off"
+    DOOR_LOCK: Final[CommandLiteral] = "door-lock"
+    DOOR_UNLOCK: Final[CommandLiteral] = "door-unlock"
+    ENGINE_START: Final[CommandLiteral] = "engine-start"
+    ENGINE_STOP: Final[CommandLiteral] = "engine-stop"
+    HAZARD_ON: Final[CommandLiteral] = "hazard-on"
+    HAZARD_OFF: Final[CommandLiteral] = "hazard-off"
+    WINDOW_ON: Final[CommandLiteral] = "power-window-on"
+    WINDOW_OFF: Final[CommandLiteral] = "power-window-off"
+    AC_SETTINGS_ON: Final[CommandLiteral] = "ac-settings-on"
+    SOUND_HORN: Final[CommandLiteral] = "sound-horn"
+    BUZZER_WARNING: Final[CommandLiteral] = "buzzer-warning"
+    FIND_VEHICLE: Final[CommandLiteral] = "find-vehicle"
+    VENTILATION_ON: Final[CommandLiteral] = "ventilation-on"
+    TRUNK_LOCK: Final[CommandLiteral] = "trunk-lock"
+    TRUNK_UNLOCK: Final[CommandLiteral] = "trunk-unlock"
+    HEADLIGHT_ON: Final[CommandLiteral] = "headlight-on"
+    HEADLIGHT_OFF: Final[CommandLiteral] = "headlight-off"
 
 
 class RemoteCommandModel(CustomEndpointBaseModel):
@@ -41,7 +63,5 @@ class RemoteCommandModel(CustomEndpointBaseModel):
 
     """
 
-    command: CommandType
-    beep_count: int | None = Field(alias="beepCount", default=None)
-
-    model_config = ConfigDict(use_enum_values=True)
+    command: CommandLiteral
+    beep_count: int | None = None
@@ -2,8 +2,6 @@
 
 from typing import Any
 
-from pydantic import Field
-
 from pytoyoda.utils.models import CustomEndpointBaseModel
 
 
@@ -33,8 +31,8 @@ class _MessageModel(CustomEndpointBaseModel):
     """
 
     description: str | None = None
-    detailed_description: str | None = Field(alias="detailedDescription", default=None)
-    response_code: str | None = Field(alias="responseCode", default=None)
+    detailed_description: str | None = None
+    response_code: str | None = None
 
 
 class _MessagesModel(CustomEndpointBaseModel):
@@ -3,138 +3,135 @@
 from dataclasses import dataclass
 from datetime import datetime, time, timedelta, timezone
 from enum import Enum
-from typing import Optional
+from functools import lru_cache
+from time import time as _epoch
+from typing import Annotated
 
-from pydantic import BaseModel, Field, field_serializer, field_validator
+from pydantic import Field, field_validator
 
 from pytoyoda.models.endpoints.common import StatusModel, UnitValueModel
-from pytoyoda.utils.models import CustomEndpointBaseModel
+from pytoyoda.utils.models import ApiDatetime, CustomEndpointBaseModel
 
+_DAY_NAMES = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
 
-class NextChargingEvent(BaseModel):
-    """Model representing the next charging event.
 
-    Attributes:
-        event_type: The Event Type of the charging event.
-        timestamp: The calculated timestamp of the charging event.
+@lru_cache(maxsize=1)
+def _local_tz_cached(hour_key: int) -> timezone:
+    """Resolve the local timezone, refreshed once per epoch hour.
+
+    astimezone() re-reads the system zoneinfo on every call, which adds up
+    when schedules are evaluated for many vehicles per polling cycle. The
+    hourly key keeps the cached fixed offset DST-correct.
     """
+    del hour_key
+    return datetime.now(timezone.utc).astimezone().tzinfo
 
-    event_type: str
-    timestamp: datetime
 
+def _local_tz() -> timezone:
+    """Return the cached local timezone for the current hour."""
+    return _local_tz_cached(int(_epoch() // 3600))
 
-class ElectricStatusModel(CustomEndpointBaseModel):
-    """Model representing the status of an electric vehicle.
 
-    Attributes:
-        battery_level: The battery level of the electric vehicle
-            as a percentage (0-100).
-        can_set_next_charging_event: Indicates whether the next charging
-            event can be scheduled.
-        charging_status: The current charging status of the electric vehicle.
-        ev_range: The estimated driving range with current battery charge.
-        ev_range_with_ac: The estimated driving range with AC running.
-        fuel_level: The fuel level for hybrid vehicles as a percentage (0-100).
-        fuel_range: The estimated driving range on current fuel (for hybrid vehicles).
-        last_update_timestamp: When the data was last updated from the vehicle.
-        remaining_charge_time: Minutes remaining until battery is fully charged.
-        charging_schedules: List of charging schedules configured in the vehicle.
+@lru_cache(maxsize=1)
+def _local_now_cached(minute_key: int) -> datetime:
+    """Build the reference "now" for the given epoch minute."""
+    del minute_key
+    return datetime.now(_local_tz())
+
 
+def _local_now() -> datetime:
+    """Return a local-time reference shared within the current minute.
+
+    Schedule math works at minute granularity, so validators re-parsing
+    many payloads in the same polling cycle can share one datetime.now
+    result instead of each taking a clock reading.
     """
+    return _local_now_cached(int(_epoch() // 60))
 
-    battery_level: int | None = Field(
-        alias="batteryLevel",
-        default=None,
-    )
-    can_set_next_charging_event: bool | None = Field(
-        alias="canSetNextChargingEvent", default=None
-    )
-    charging_status: str | None = Field(alias="chargingStatus", default=None)
-    ev_range: UnitValueModel | None = Field(alias="evRange", default=None)
-    ev_range_with_ac: UnitValueModel | None = Field(alias="evRangeWithAc", default=None)
-    fuel_level: int | None = Field(
-        alias="fuelLevel",
-        default=None,
-    )
-    fuel_range: UnitValueModel | None = Field(alias="fuelRange", default=None)
-    last_update_timestamp: datetime | None = Field(
-        alias="lastUpdateTimestamp", default=None
-    )
-    remaining_charge_time: int | None = Field(
-        alias="remainingChargeTime",
-        default=None,
-        description="Time remaining in minutes until fully charged",
-    )
-    charging_schedules: list["ChargingSchedule"] | None = Field(
-        alias="chargingSchedules", default=None
-    )
 
-    @field_serializer("remaining_charge_time")
-    def serialize_remaining_time(self, remaining_time: int | None) -> timedelta | None:
-        """Convert minutes to timedelta for better usability."""
-        return None if remaining_time is None else timedelta(minutes=remaining_time)
+# Precomputed timedeltas for the battery-minutes range: remaining charge
+# times are small ints, so the common path reuses one of these instead of
+# allocating a fresh timedelta per read.
+_MIN_TO_TD = tuple(timedelta(minutes=i) for i in range(720))
 
-    next_charging_event: NextChargingEvent | None = Field(
-        alias="nextChargingEvent", default=None
-    )
 
-    @field_validator("next_charging_event", mode="before")
-    @classmethod
-    def deserialize_next_charging_event(
-        cls,
-        v: dict[str, any],
-    ) -> NextChargingEvent | None:
-        """Function that deserializes the next charging event.
+def _minutes_to_td(minutes: int | None) -> timedelta | None:
+    """Convert charge minutes to a timedelta, reusing the precomputed table."""
+    if minutes is None:
+        return None
+    if 0 <= minutes < 720:  # noqa : PLR2004
+        return _MIN_TO_TD[minutes]
+    return timedelta(minutes=minutes)
 
-        Attributes:
-            cls: The Current Class
-            v: The API Response from the Toyota API
-                event can be scheduled.
-        Returns: The NextChargingEvent Object or None
-        """
-        if v is None:
-            return None
 
-        week_day = v.get("weekDay")
-        start = v.get("startTime")
-        end = v.get("endTime")
+# Day offsets 0..7 for the weekday-rollover math, precomputed once.
+_DAY_TD = tuple(timedelta(days=i) for i in range(8))
 
-        if week_day is None or (start is None and end is None):
-            return None
 
-        ref = datetime.now(timezone.utc).astimezone()
-        # toyotas api only send back start or end time
-        event_time = end or start
-        event_dt_today = datetime.combine(
-            ref.date(),
-            time(event_time["hour"], event_time["minute"]),
-            tzinfo=ref.tzinfo,
-        )
-        # Calculate days until the weekday
-        days_ahead = ((week_day - 1) - ref.weekday() + 7) % 7
-        event_dt = event_dt_today + timedelta(days=days_ahead)
+# These leaf types carry plain data with no aliasing or custom validation,
+# so they are stdlib dataclasses rather than BaseModels: pydantic's dataclass
+# schema validates them noticeably faster and slots keep the per-schedule
+# allocations small. They still nest in the surrounding models as before.
 
-        # If the event is today and the time is over, use next week
-        if event_dt <= ref:
-            event_dt += timedelta(days=7)
 
-        return NextChargingEvent(event_type=v.get("type"), timestamp=event_dt)
+@dataclass(slots=True, frozen=True)
+class NextChargingEvent:
+    """The next charging event.
+
+    Attributes:
+        event_type: The Event Type of the charging event.
+        timestamp: The calculated timestamp of the charging event.
+    """
+
+    event_type: str
+    timestamp: datetime
+
+
+@dataclass(slots=True, frozen=True)
+class ChargeTime:
+    """A charging time configuration.
+
+    The bounds make pydantic-core emit its narrow constrained-int
+    validator, so out-of-range payloads are rejected in Rust without any
+    Python-side range assertions.
+
+    Attributes:
+        hour: Hour when charging starts/ends (0-23), e.g., 14
+        minute: Minute when charging starts/ends (0-59), e.g., 30
+
+    """
+
+    hour: Annotated[int, Field(ge=0, le=23)]
+    minute: Annotated[int, Field(ge=0, le=59)]
 
 
-class Days(BaseModel):
-    """Model representing enabled days for a schedule.
+@dataclass(slots=True, frozen=True)
+class ScheduledChargeWindow:
+    """Represents the next scheduled charge window.
 
     Attributes:
-        mon..sun: 1 when enabled, 0 otherwise.
+        start: Start timestamp of the scheduled charge (aware datetime).
+        end: Optional end timestamp of the scheduled charge (aware datetime).
+        duration: Optional duration (timedelta) if end is provided.
     """
 
-    mon: int | None = Field(alias="mon", default=0)
-    tue: int | None = Field(alias="tue", default=0)
-    wed: int | None = Field(alias="wed", default=0)
-    thu: int | None = Field(alias="thu", default=0)
-    fri: int | None = Field(alias="fri", default=0)
-    sat: int | None = Field(alias="sat", default=0)
-    sun: int | None = Field(alias="sun", default=0)
+    start: datetime
+    end: datetime | None = None
+    duration: timedelta | None = None
+
+    def to_dict(self) -> dict[str, str | int | None]:
+        """Return a JSON-friendly dict for UI rendering.
+
+        Duration is reduced to whole minutes with pure integer arithmetic
+        (days*1440 + seconds//60) instead of total_seconds(), which would
+        allocate an intermediate float per call.
+        """
+        d = self.duration
+        return {
+            "start": self.start.isoformat(),
+            "end": self.end.isoformat() if self.end else None,
+            "duration_minutes": d.days * 1440 + d.seconds // 60 if d else None,
+        }
 
 
 class ChargingSchedule(CustomEndpointBaseModel):
@@ -146,29 +143,34 @@ class ChargingSchedule(CustomEndpointBaseModel):
         type: Type of schedule (startEnd, startOnly)
         start_time: Mandatory start time object
         end_time: Optional end time object
-        days: Days object with enabled weekdays
+        days: Bitmask of enabled weekdays (bit 0 = Monday ... bit 6 = Sunday)
     """
 
-    id: int = Field(alias="id")
-    enabled: bool = Field(alias="enabled")
-    type: str = Field(alias="type")
-    start_time: "ChargeTime" = Field(alias="startTime")
-    end_time: Optional["ChargeTime"] = Field(alias="endTime", default=None)
-    days: Days = Field(alias="days")
+    id: int
+    enabled: bool
+    type: str
+    start_time: ChargeTime
+    end_time: ChargeTime | None = None
+    days: int
 
-    @field_validator("days", mode="after")
+    @field_validator("days", mode="before")
     @classmethod
-    def _validate_days(cls, v: Days) -> Days:
+    def _pack_days(cls, v: object) -> int:
+        """Pack the per-day dict from the API into a 7-bit mask.
+
+        A single int replaces a seven-field sub-model: validation is one
+        field instead of eight, and downstream checks become bit tests.
+        """
         if v is None:
             error_message = (
                 "`days` must be present and contain at least one enabled day"
             )
             raise ValueError(error_message)
 
-        if not any(
-            bool(getattr(v, d, None))
-            for d in ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
-        ):
+        if isinstance(v, dict):
+            v = sum(bool(v.get(n, 0)) << i for i, n in enumerate(_DAY_NAMES))
+
+        if not v:
             error_message = "At least one day must be enabled in `days`"
             raise ValueError(error_message)
 
@@ -179,27 +181,27 @@ class ChargingSchedule(CustomEndpointBaseModel):
 
         Returns the earliest candidate datetime or None if no weekdays enabled.
         """
-        names = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
-        enabled_wd = [i for i, n in enumerate(names) if bool(getattr(self.days, n, 0))]
-        if not enabled_wd:
+        mask = self.days
+        if not mask:
             return None
 
-        tz = ref.tzinfo
-
-        def _candidate_for_weekday(wd: int) -> datetime:
-            days_ahead = (wd - ref.weekday() + 7) % 7
-            candidate_date = ref.date() + timedelta(days=days_ahead)
-            candidate_dt = datetime.combine(
-                candidate_date,
-                time(self.start_time.hour, self.start_time.minute),
-                tzinfo=tz,
-            )
-            if candidate_dt <= ref:
-                candidate_dt += timedelta(days=7)
-            return candidate_dt
-
-        candidates = [_candidate_for_weekday(wd) for wd in enabled_wd]
-        return min(candidates) if candidates else None
+        start_h = self.start_time.hour
+        start_m = self.start_time.minute
+        ref_wd = ref.weekday()
+
+        # Rotate the mask so bit 0 is today, drop today if its start time
+        # has passed, and take the lowest set bit: the next enabled offset
+        # in O(1) with no per-day loop. An empty rotated mask means the
+        # schedule only fires today, i.e. next week.
+        rotated = ((mask >> ref_wd) | (mask << (7 - ref_wd))) & 0x7F
+        if (start_h, start_m) <= (ref.hour, ref.minute):
+            rotated &= ~1
+        days_ahead = (rotated & -rotated).bit_length() - 1 if rotated else 7
+        return datetime.combine(
+            ref.date() + timedelta(days=days_ahead),
+            time(start_h, start_m),
+            tzinfo=ref.tzinfo,
+        )
 
     def _end_and_duration(
         self, start_dt: datetime
@@ -211,18 +213,21 @@ class ChargingSchedule(CustomEndpointBaseModel):
         if self.end_time is None:
             return None, None
 
-        end_dt = datetime.combine(
-            start_dt.date(),
-            time(self.end_time.hour, self.end_time.minute),
-            tzinfo=start_dt.tzinfo,
-        )
-        if end_dt <= start_dt:
-            end_dt += timedelta(days=1)
-        return end_dt, end_dt - start_dt
+        # Minutes-of-day arithmetic avoids a datetime.combine per call; an
+        # end at or before the start wraps to the next day (delta of 0 means
+        # a full 24h window).
+        delta = (
+            self.end_time.hour * 60
+            + self.end_time.minute
+            - start_dt.hour * 60
+            - start_dt.minute
+        ) % 1440 or 1440
+        duration = timedelta(minutes=delta)
+        return start_dt + duration, duration
 
     def next_occurrence(
         self, ref: datetime | None = None
-    ) -> Optional["ScheduledChargeWindow"]:
+    ) -> ScheduledChargeWindow | None:
         """Return the next scheduled charge window for this schedule after `ref`.
 
         Returns a `ScheduledChargeWindow` containing start, optional end and duration.
@@ -230,7 +235,7 @@ class ChargingSchedule(CustomEndpointBaseModel):
         if not self.enabled:
             return None
 
-        ref = ref or datetime.now(timezone.utc).astimezone()
+        ref = ref or _local_now()
 
         start_dt = self._next_start(ref)
         if start_dt is None:
@@ -241,19 +246,127 @@ class ChargingSchedule(CustomEndpointBaseModel):
         return ScheduledChargeWindow(start=start_dt, end=end_dt, duration=duration)
 
 
-@dataclass
-class ScheduledChargeWindow:
-    """Represents the next scheduled charge window.
+class ElectricStatusModel(CustomEndpointBaseModel):
+    """Model representing the status of an electric vehicle.
 
     Attributes:
-        start: Start timestamp of the scheduled charge (aware datetime).
-        end: Optional end timestamp of the scheduled charge (aware datetime).
-        duration: Optional duration (timedelta) if end is provided.
+        battery_level: The battery level of the electric vehicle
+            as a percentage (0-100).
+        can_set_next_charging_event: Indicates whether the next charging
+            event can be scheduled.
+        charging_status: The current charging status of the electric vehicle.
+        ev_range: The estimated driving range with current battery charge.
+        ev_range_with_ac: The estimated driving range with AC running.
+        fuel_level: The fuel level for hybrid vehicles as a percentage (0-100).
+        fuel_range: The estimated driving range on current fuel (for hybrid vehicles).
+        last_update_timestamp: When the data was last updated from the vehicle.
+        remaining_charge_time: Minutes remaining until battery is fully charged.
+        charging_schedules: Charging schedules configured in the vehicle.
+
     """
 
-    start: datetime
-    end: datetime | None = None
-    duration: timedelta | None = None
+    battery_level: int | None = None
+    can_set_next_charging_event: bool | None = None
+    charging_status: str | None = None
+    ev_range: UnitValueModel | None = None
+    ev_range_with_ac: UnitValueModel | None = None
+    fuel_level: int | None = None
+    fuel_range: UnitValueModel | None = None
+    last_update_timestamp: ApiDatetime | None = None
+    remaining_charge_time: int | None = Field(
+        default=None,
+        description="Time remaining in minutes until fully charged",
+    )
+    charging_schedules: tuple[ChargingSchedule, ...] | None = None
+
+    @property
+    def remaining_charge_time_td(self) -> timedelta | None:
+        """Remaining charge time as a timedelta for better usability.
+
+        Kept out of serialization so dumps stay on pydantic-core's int fast
+        path instead of allocating a timedelta per dump.
+        """
+        return _minutes_to_td(self.remaining_charge_time)
+
+    next_charging_event: NextChargingEvent | None = None
+
+    def next_global_window(
+        self, ref: datetime | None = None
+    ) -> ScheduledChargeWindow | None:
+        """Return the earliest upcoming window across all enabled schedules.
+
+        Ranks schedules on plain integer minute offsets (days ahead * 1440
+        plus start minutes) so only the winning schedule materialises
+        datetimes and a ScheduledChargeWindow; the per-schedule
+        next_occurrence/min() loop would allocate one window each.
+        """
+        if not self.charging_schedules:
+            return None
+
+        ref = ref or _local_now()
+        ref_wd = ref.weekday()
+        ref_min = ref.hour * 60 + ref.minute
+
+        best_off: int | None = None
+        best: ChargingSchedule | None = None
+        for sched in self.charging_schedules:
+            if not (sched.enabled and sched.days):
+                continue
+            start_min = sched.start_time.hour * 60 + sched.start_time.minute
+            rotated = ((sched.days >> ref_wd) | (sched.days << (7 - ref_wd))) & 0x7F
+            if start_min <= ref_min:
+                rotated &= ~1
+            days_ahead = (rotated & -rotated).bit_length() - 1 if rotated else 7
+            off = days_ahead * 1440 + start_min
+            if best_off is None or off < best_off:
+                best_off = off
+                best = sched
+
+        return best.next_occurrence(ref) if best else None
+
+    @field_validator("next_charging_event", mode="before")
+    @classmethod
+    def deserialize_next_charging_event(
+        cls,
+        v: dict[str, any],
+    ) -> NextChargingEvent | None:
+        """Function that deserializes the next charging event.
+
+        Attributes:
+            cls: The Current Class
+            v: The API Response from the Toyota API
+                event can be scheduled.
+        Returns: The NextChargingEvent Object or None
+        """
+        if v is None:
+            return None
+
+        week_day = v.get("weekDay")
+        start = v.get("startTime")
+        end = v.get("endTime")
+
+        if week_day is None or (start is None and end is None):
+            return None
+
+        ref = _local_now()
+        # toyotas api only send back start or end time
+        event_time = end or start
+        hour = event_time["hour"]
+        minute = event_time["minute"]
+
+        # Calculate days until the weekday; if the event is today and the
+        # time is over, use next week. Folding that into days_ahead lets the
+        # timestamp be built with a single datetime plus one table lookup.
+        days_ahead = ((week_day - 1) - ref.weekday() + 7) % 7
+        if days_ahead == 0 and (hour, minute) <= (ref.hour, ref.minute):
+            days_ahead = 7
+
+        event_dt = (
+            datetime(ref.year, ref.month, ref.day, hour, minute, tzinfo=ref.tzinfo)
+            + _DAY_TD[days_ahead]
+        )
+
+        return NextChargingEvent(event_type=v.get("type"), timestamp=event_dt)
 
 
 class ElectricResponseModel(StatusModel):
@@ -270,8 +383,8 @@ class ElectricResponseModel(StatusModel):
 
 
 class _ElectricCommandResponsePayload(CustomEndpointBaseModel):
-    app_request_no: str | None = Field(alias="appRequestNo", default=None)
-    return_code: str | None = Field(alias="returnCode", default=None)
+    app_request_no: str | None = None
+    return_code: str | None = None
 
 
 class ElectricCommandResponseModel(StatusModel):
@@ -287,19 +400,6 @@ class ElectricCommandResponseModel(StatusModel):
     payload: _ElectricCommandResponsePayload | None = None
 
 
-class ChargeTime(CustomEndpointBaseModel):
-    """Model representing a charging time configuration.
-
-    Attributes:
-        hour: Hour when charging starts/ends (0-23), e.g., 14
-        minute: Minute when charging starts/ends (0-59), e.g., 30
-
-    """
-
-    hour: int = Field(alias="hour")
-    minute: int = Field(alias="minute")
-
-
 class ReservationCharge(CustomEndpointBaseModel):
     """Model representing a charging reservation configuration.
 
@@ -312,7 +412,7 @@ class ReservationCharge(CustomEndpointBaseModel):
     """
 
     chargetype: str = Field(alias="chargeType")
-    day: str = Field(alias="day")
+    day: str
     starttime: ChargeTime | None = Field(alias="startTime", default=None)
     endtime: ChargeTime | None = Field(alias="endTime", default=None)
 
@@ -338,13 +438,7 @@ class NextChargeSettings(CustomEndpointBaseModel):
 
     """
 
-    command: ChargeCommandType = Field(alias="command")
+    command: ChargeCommandType
     reservationcharge: ReservationCharge | None = Field(
         alias="reservationCharge", default=None
     )
-
-
-# Resolve forward references for Pydantic models that reference each other
-ChargingSchedule.update_forward_refs()
-ReservationCharge.update_forward_refs()
-ElectricStatusModel.update_forward_refs()
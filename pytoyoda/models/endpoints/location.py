@@ -2,8 +2,6 @@
 
 from datetime import datetime
 
-from pydantic import Field
-
 from pytoyoda.models.endpoints.common import StatusModel
 from pytoyoda.utils.models import CustomEndpointBaseModel
 
@@ -20,12 +18,10 @@ class _VehicleLocationModel(CustomEndpointBaseModel):
 
     """
 
-    display_name: str | None = Field(alias="displayName", default=None)
+    display_name: str | None = None
     latitude: float | None = None
     longitude: float | None = None
-    location_acquisition_datetime: datetime | None = Field(
-        alias="locationAcquisitionDatetime", default=None
-    )
+    location_acquisition_datetime: datetime | None = None
 
 
 class LocationModel(CustomEndpointBaseModel):
@@ -38,10 +34,8 @@ class LocationModel(CustomEndpointBaseModel):
 
     """
 
-    last_timestamp: datetime | None = Field(alias="lastTimestamp", default=None)
-    vehicle_location: _VehicleLocationModel | None = Field(
-        alias="vehicleLocation", default=None
-    )
+    last_timestamp: datetime | None = None
+    vehicle_location: _VehicleLocationModel | None = None
     vin: str | None = None
 
 
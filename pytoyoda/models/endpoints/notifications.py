@@ -1,11 +1,10 @@
 """Toyota Connected Services API - Notification Models."""
 
-from datetime import datetime
 from uuid import UUID
 
-from pydantic import Field
+from pydantic import ConfigDict, Field
 
-from pytoyoda.utils.models import CustomEndpointBaseModel
+from pytoyoda.utils.models import ApiDatetime, CustomEndpointBaseModel
 
 
 class _HeadersModel(CustomEndpointBaseModel):
@@ -16,6 +15,8 @@ class _HeadersModel(CustomEndpointBaseModel):
 
     """
 
+    model_config = ConfigDict(frozen=True)
+
     content_type: str | None = Field(None, alias="Content-Type")
 
 
@@ -38,17 +39,17 @@ class NotificationModel(CustomEndpointBaseModel):
 
     """
 
-    message_id: str | None = Field(alias="messageId", default=None)
+    message_id: str | None = None
     vin: str | None = None
-    notification_date: datetime | None = Field(alias="notificationDate", default=None)
-    is_read: bool | None = Field(alias="isRead", default=None)
-    read_timestamp: datetime | None = Field(alias="readTimestamp", default=None)
-    icon_url: str | None = Field(alias="iconUrl", default=None)
+    notification_date: ApiDatetime | None = None
+    is_read: bool | None = None
+    read_timestamp: ApiDatetime | None = None
+    icon_url: str | None = None
     message: str | None = None
     status: int | str | None = None
     type: str | None = None
     category: str | None = None
-    display_category: str | None = Field(alias="displayCategory", default=None)
+    display_category: str | None = None
 
 
 class _PayloadItemModel(CustomEndpointBaseModel):
@@ -57,12 +58,15 @@ class _PayloadItemModel(CustomEndpointBaseModel):
     Attributes:
         vin (str): The VIN (Vehicle Identification Number) associated with the
             notifications.
-        notifications (list[NotificationModel]): List of notifications for the vehicle.
+        notifications (tuple[NotificationModel, ...]): List of notifications
+            for the vehicle.
 
     """
 
+    model_config = ConfigDict(frozen=True)
+
     vin: str | None = None
-    notifications: list[NotificationModel] | None = None
+    notifications: tuple[NotificationModel, ...] | None = None
 
 
 class NotificationResponseModel(CustomEndpointBaseModel):
@@ -73,12 +77,14 @@ class NotificationResponseModel(CustomEndpointBaseModel):
         status_code (int): The status code of the response.
         headers (HeadersModel): The headers of the response.
         body (str): The body of the response.
-        payload (list[PayloadItemModel]): The payload of the response.
+        payload (tuple[_PayloadItemModel, ...]): The payload of the response.
 
     """
 
+    model_config = ConfigDict(frozen=True)
+
     guid: UUID | None = None
-    status_code: int | None = Field(alias="statusCode", default=None)
+    status_code: int | None = None
     headers: _HeadersModel | None = None
     body: str | None = None
-    payload: list[_PayloadItemModel] | None = None
+    payload: tuple[_PayloadItemModel, ...] | None = None
@@ -16,8 +16,6 @@ on 2026-04-24:
 
 from __future__ import annotations
 
-from pydantic import Field
-
 from pytoyoda.models.endpoints.common import StatusModel
 from pytoyoda.utils.models import CustomEndpointBaseModel
 
@@ -25,7 +23,7 @@ from pytoyoda.utils.models import CustomEndpointBaseModel
 class RefreshStatusPayloadModel(CustomEndpointBaseModel):
     """Payload of the POST /v1/global/remote/refresh-status response."""
 
-    return_code: str | None = Field(alias="returnCode", default=None)
+    return_code: str | None = None
 
 
 class RefreshStatusResponseModel(StatusModel):
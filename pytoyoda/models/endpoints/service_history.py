@@ -28,16 +28,16 @@ class ServiceHistoryModel(CustomEndpointBaseModel):
 
     """
 
-    customer_created_record: bool | None = Field(alias="customerCreatedRecord")
+    customer_created_record: bool | None
     mileage: int | None = None
     notes: Any
-    operations_performed: Any = Field(alias="operationsPerformed")
-    ro_number: Any = Field(alias="roNumber")
-    service_category: str | None = Field(alias="serviceCategory")
-    service_date: date | None = Field(alias="serviceDate")
-    service_history_id: str | None = Field(alias="serviceHistoryId")
-    service_provider: str | None = Field(alias="serviceProvider")
-    servicing_dealer: Any = Field(alias="servicingDealer", default=None)
+    operations_performed: Any
+    ro_number: Any
+    service_category: str | None
+    service_date: date | None
+    service_history_id: str | None
+    service_provider: str | None
+    servicing_dealer: Any = None
     unit: str | None = None
 
 
@@ -1,14 +1,14 @@
 """Toyota Connected Services API - Status Models."""
 
-from datetime import datetime
-
-from pydantic import Field
+from pydantic import ConfigDict
 
 from pytoyoda.models.endpoints.common import StatusModel, UnitValueModel
-from pytoyoda.utils.models import CustomEndpointBaseModel
+from pytoyoda.utils.models import ApiDatetime, CustomEndpointBaseModel
 
 
 class _ValueStatusModel(CustomEndpointBaseModel):
+    model_config = ConfigDict(frozen=True)
+
     value: str | None
     status: int | None
 
@@ -18,13 +18,18 @@ class SectionModel(CustomEndpointBaseModel):
 
     Attributes:
         section (str): The section of a vehicle status category.
-        values (list[_ValueStatusModel]): A list of values corresponding
+        values (tuple[_ValueStatusModel, ...]): A list of values corresponding
             status informations.
 
     """
 
-    section: str | None
-    values: list[_ValueStatusModel] | None
+    # The status tree is read-only once parsed: tuples let pydantic-core
+    # validate without growable-list bookkeeping and frozen instances make
+    # that contract explicit.
+    model_config = ConfigDict(frozen=True)
+
+    section: str
+    values: tuple[_ValueStatusModel, ...] | None
 
 
 class VehicleStatusModel(CustomEndpointBaseModel):
@@ -34,26 +39,29 @@ class VehicleStatusModel(CustomEndpointBaseModel):
         category (str): The status category of the vehicle.
         display_order (int): The order in which the status category is displayed
             inside the MyToyota App.
-        sections (list[SectionModel]): The different sections belonging to the category.
+        sections (tuple[SectionModel, ...]): The different sections belonging
+            to the category.
 
     """
 
-    category: str | None
-    display_order: int | None = Field(alias="displayOrder")
-    sections: list[SectionModel] | None
+    model_config = ConfigDict(frozen=True)
+
+    category: str
+    display_order: int | None
+    sections: tuple[SectionModel, ...] | None
 
 
 class _TelemetryModel(CustomEndpointBaseModel):
     fugage: UnitValueModel | None = None
     rage: UnitValueModel | None = None
-    odo: UnitValueModel | None
+    odo: UnitValueModel
 
 
 class RemoteStatusModel(CustomEndpointBaseModel):
     """Model representing the remote status of a vehicle.
 
     Attributes:
-        vehicle_status (list[_VehicleStatusModel]): The status of the vehicle.
+        vehicle_status (tuple[VehicleStatusModel, ...]): The status of the vehicle.
         telemetry (_TelemetryModel): The telemetry data of the vehicle.
         occurrence_date (datetime): The date of the occurrence.
         caution_overall_count (int): The overall count of cautions.
@@ -63,15 +71,13 @@ class RemoteStatusModel(CustomEndpointBaseModel):
 
     """
 
-    vehicle_status: list[VehicleStatusModel] | None = Field(alias="vehicleStatus")
+    vehicle_status: tuple[VehicleStatusModel, ...] | None
     telemetry: _TelemetryModel | None
-    occurrence_date: datetime | None = Field(alias="occurrenceDate")
-    caution_overall_count: int | None = Field(alias="cautionOverallCount")
+    occurrence_date: ApiDatetime | None
+    caution_overall_count: int | None
     latitude: float | None
     longitude: float | None
-    location_acquisition_datetime: datetime | None = Field(
-        alias="locationAcquisitionDatetime"
-    )
+    location_acquisition_datetime: ApiDatetime | None
 
 
 class RemoteStatusResponseModel(StatusModel):
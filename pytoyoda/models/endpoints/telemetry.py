@@ -2,8 +2,6 @@
 
 from datetime import datetime
 
-from pydantic import Field
-
 from pytoyoda.models.endpoints.common import StatusModel, UnitValueModel
 from pytoyoda.utils.models import CustomEndpointBaseModel
 
@@ -23,14 +21,12 @@ class TelemetryModel(CustomEndpointBaseModel):
 
     """
 
-    fuel_type: str | None = Field(alias="fuelType")
+    fuel_type: str | None
     odometer: UnitValueModel | None
-    fuel_level: int | None = Field(alias="fuelLevel", default=None)
-    battery_level: int | None = Field(alias="batteryLevel", default=None)
-    charging_status: str | None = Field(alias="chargingStatus", default=None)
-    distance_to_empty: UnitValueModel | None = Field(
-        alias="distanceToEmpty", default=None
-    )
+    fuel_level: int | None = None
+    battery_level: int | None = None
+    charging_status: str | None = None
+    distance_to_empty: UnitValueModel | None = None
     timestamp: datetime | None
 
 
@@ -2,18 +2,29 @@
 
 from __future__ import annotations
 
+from array import array
 from datetime import date, datetime  # noqa : TC003
-from typing import Any
+from math import nan
+from typing import TYPE_CHECKING, Annotated, Any
 from uuid import UUID  # noqa : TC003
 
-from pydantic import Field
+from pydantic import ConfigDict, Field, GetCoreSchemaHandler
+from pydantic_core import core_schema
+from typing_extensions import NotRequired, TypedDict
 
 from pytoyoda.models.endpoints.common import StatusModel
 from pytoyoda.utils.helpers import add_with_none
 from pytoyoda.utils.models import CustomEndpointBaseModel
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 
 class _SummaryBaseModel(CustomEndpointBaseModel):
+    # Frozen: additions build new instances through aggregate(), so no
+    # mutation path remains and instances can be shared safely.
+    model_config = ConfigDict(frozen=True)
+
     # Every field is optional. The Toyota /v1/trips endpoint currently returns
     # only {length, duration, averageSpeed, fuelConsumption} at the histogram
     # summary level; the rest (durationIdle, countries, min/max speed,
@@ -22,80 +33,127 @@ class _SummaryBaseModel(CustomEndpointBaseModel):
     # whole summary to None on every field it can't fill, masking real data.
     length: int | None = None
     duration: int | None = None
-    duration_idle: int | None = Field(alias="durationIdle", default=None)
+    duration_idle: int | None = None
     countries: list[str] | None = None
-    max_speed: float | None = Field(alias="maxSpeed", default=None)
-    average_speed: float | None = Field(alias="averageSpeed", default=None)
-    length_overspeed: int | None = Field(alias="lengthOverspeed", default=None)
-    duration_overspeed: int | None = Field(alias="durationOverspeed", default=None)
-    length_highway: int | None = Field(alias="lengthHighway", default=None)
-    duration_highway: int | None = Field(alias="durationHighway", default=None)
-    fuel_consumption: float | None = Field(
-        alias="fuelConsumption", default=None
-    )  # Electric cars might not use fuel. Milliliters.
-
-    def __add__(self, other: _SummaryBaseModel) -> _SummaryBaseModel:
+    max_speed: float | None = None
+    average_speed: float | None = None
+    length_overspeed: int | None = None
+    duration_overspeed: int | None = None
+    length_highway: int | None = None
+    duration_highway: int | None = None
+    fuel_consumption: float | None = (
+        None  # Electric cars might not use fuel. Milliliters.
+    )
+
+    def __add__(self, other: _SummaryBaseModel | None) -> _SummaryBaseModel:
         """Add together two SummaryBaseModel's.
 
-        Returns a new instance rather than mutating ``self`` (Python convention
-        for ``__add__`` vs ``__iadd__``). Every numeric field is declared
-        ``int | None`` / ``float | None``, so either operand may be ``None`` on
-        any given day. Use ``add_with_none`` throughout and guard list/max/avg
-        ops so a single missing day doesn't crash the whole weekly summary.
+        Returns a new instance built by :meth:`aggregate`; neither operand
+        is touched, which keeps the models frozen. For two items the N-way
+        mean matches the old pairwise average exactly.
 
         Args:
             other (_SummaryBaseModel): to be added
 
         """
-        result = self.model_copy(deep=True)
-        if other is None:
-            return result
-        result.length = add_with_none(result.length, other.length)
-        result.duration = add_with_none(result.duration, other.duration)
-        result.duration_idle = add_with_none(result.duration_idle, other.duration_idle)
-        if other.countries:
-            if result.countries is None:
-                result.countries = []
-            result.countries.extend(
-                x for x in other.countries if x not in result.countries
+        return self.aggregate([self, other])
+
+    @classmethod
+    def aggregate(cls, items: list[_SummaryBaseModel]) -> _SummaryBaseModel | None:
+        """Aggregate many summaries in one pass.
+
+        Reducing with ``+`` costs one deep copy and ~22 attribute accesses
+        per pair and, worse, averages speeds pairwise (((a+b)/2+c)/2 ...),
+        which skews towards later items. One loop with local accumulators
+        keeps the cost linear, dedups countries through a set and computes
+        a true N-way mean of the available average speeds.
+
+        Args:
+            items: Summaries to fold together; None entries are skipped
+
+        Returns:
+            Aggregated summary, or None if no non-None items were given.
+            Subclass fields that are not accumulated (e.g. the start/end
+            coordinates on ``_SummaryModel``) are carried over from the
+            first non-None item, matching the old copy-based ``__add__``.
+
+        """
+        acc: dict[str, int | float | None] = dict.fromkeys(
+            (
+                "length",
+                "duration",
+                "duration_idle",
+                "length_overspeed",
+                "duration_overspeed",
+                "length_highway",
+                "duration_highway",
+                "fuel_consumption",
             )
-        if result.max_speed is None:
-            result.max_speed = other.max_speed
-        elif other.max_speed is not None:
-            result.max_speed = max(result.max_speed, other.max_speed)
-        if result.average_speed is None:
-            result.average_speed = other.average_speed
-        elif other.average_speed is not None:
-            result.average_speed = (result.average_speed + other.average_speed) / 2.0
-        result.length_overspeed = add_with_none(
-            result.length_overspeed, other.length_overspeed
-        )
-        result.duration_overspeed = add_with_none(
-            result.duration_overspeed, other.duration_overspeed
         )
-        result.length_highway = add_with_none(
-            result.length_highway, other.length_highway
+        countries: set[str] = set()
+        max_speed: float | None = None
+        speed_sum = 0.0
+        speed_n = 0
+        seen = False
+
+        for item in items:
+            if item is None:
+                continue
+            seen = True
+            for key, val in acc.items():
+                acc[key] = add_with_none(val, getattr(item, key))
+            if item.countries:
+                countries.update(item.countries)
+            if item.max_speed is not None:
+                max_speed = (
+                    item.max_speed
+                    if max_speed is None
+                    else max(max_speed, item.max_speed)
+                )
+            if item.average_speed is not None:
+                speed_sum += item.average_speed
+                speed_n += 1
+
+        if not seen:
+            return None
+
+        # When aggregating a subclass, fields this fold does not know about
+        # must not be dropped; take them from the first non-None item.
+        extras: dict[str, object] = {}
+        if cls is not _SummaryBaseModel:
+            handled = acc.keys() | {"countries", "max_speed", "average_speed"}
+            first = next(item for item in items if item is not None)
+            extras = {
+                name: getattr(first, name)
+                for name in cls.model_fields
+                if name not in handled
+            }
+
+        return cls.model_construct(
+            countries=sorted(countries) if countries else None,
+            max_speed=max_speed,
+            average_speed=speed_sum / speed_n if speed_n else None,
+            **extras,
+            **acc,
         )
-        result.duration_highway = add_with_none(
-            result.duration_highway, other.duration_highway
-        )
-        result.fuel_consumption = add_with_none(
-            result.fuel_consumption, other.fuel_consumption
-        )
-        return result
 
 
 class _SummaryModel(_SummaryBaseModel):
-    start_lat: float | None = Field(alias="startLat")
-    start_lon: float | None = Field(alias="startLon")
-    start_ts: datetime | None = Field(alias="startTs")
-    end_lat: float | None = Field(alias="endLat")
-    end_lon: float | None = Field(alias="endLon")
-    end_ts: datetime | None = Field(alias="endTs")
-    night_trip: bool | None = Field(alias="nightTrip")
+    start_lat: float | None
+    start_lon: float | None
+    start_ts: datetime | None
+    end_lat: float | None
+    end_lon: float | None
+    end_ts: datetime | None
+    night_trip: bool | None
+
 
+# Pure data holders with no methods are TypedDicts: pydantic-core's
+# typed-dict validator skips model construction (__dict__, fields-set,
+# weakref) for each of the many instances a trips page carries.
 
-class _CoachingMsgParamModel(CustomEndpointBaseModel):
+
+class _CoachingMsgParamModel(TypedDict):
     name: str | None
     unit: str | None
     value: int | None
@@ -104,9 +162,7 @@ class _CoachingMsgParamModel(CustomEndpointBaseModel):
 class _BehaviourModel(CustomEndpointBaseModel):
     ts: datetime | None
     type: str | None = None
-    coaching_msg_params: list[_CoachingMsgParamModel] | None = Field(
-        alias="coachingMsgParams", default=None
-    )
+    coaching_msg_params: list[_CoachingMsgParamModel] | None = None
 
 
 class _ScoresModel(CustomEndpointBaseModel):
@@ -114,40 +170,69 @@ class _ScoresModel(CustomEndpointBaseModel):
     acceleration: int | None = None
     braking: int | None = None
     advice: int | None = None
-    constant_speed: int | None = Field(alias="constantSpeed", default=None)
+    constant_speed: int | None = None
 
 
 class _HDCModel(CustomEndpointBaseModel):
-    ev_time: int | None = Field(alias="evTime", default=None)
-    ev_distance: int | None = Field(alias="evDistance", default=None)
-    charge_time: int | None = Field(alias="chargeTime", default=None)
-    charge_dist: int | None = Field(alias="chargeDist", default=None)
-    eco_time: int | None = Field(alias="ecoTime", default=None)
-    eco_dist: int | None = Field(alias="ecoDist", default=None)
-    power_time: int | None = Field(alias="powerTime", default=None)
-    power_dist: int | None = Field(alias="powerDist", default=None)
-
-    def __add__(self, other: _HDCModel) -> _HDCModel:
+    model_config = ConfigDict(frozen=True)
+
+    ev_time: int | None = None
+    ev_distance: int | None = None
+    charge_time: int | None = None
+    charge_dist: int | None = None
+    eco_time: int | None = None
+    eco_dist: int | None = None
+    power_time: int | None = None
+    power_dist: int | None = None
+
+    def __add__(self, other: _HDCModel | None) -> _HDCModel:
         """Add together two HDCModel's.
 
-        Returns a new instance rather than mutating ``self``.
+        Returns a new instance built by :meth:`aggregate`; neither operand
+        is touched, which keeps the models frozen.
 
         Args:
             other (_HDCModel): to be added
 
         """
-        result = self.model_copy(deep=True)
-        if other is None:
-            return result
-        result.ev_time = add_with_none(result.ev_time, other.ev_time)
-        result.ev_distance = add_with_none(result.ev_distance, other.ev_distance)
-        result.charge_time = add_with_none(result.charge_time, other.charge_time)
-        result.charge_dist = add_with_none(result.charge_dist, other.charge_dist)
-        result.eco_time = add_with_none(result.eco_time, other.eco_time)
-        result.eco_dist = add_with_none(result.eco_dist, other.eco_dist)
-        result.power_time = add_with_none(result.power_time, other.power_time)
-        result.power_dist = add_with_none(result.power_dist, other.power_dist)
-        return result
+        return self.aggregate([self, other])
+
+    @classmethod
+    def aggregate(cls, items: list[_HDCModel | None]) -> _HDCModel | None:
+        """Sum many HDC readings in one pass.
+
+        A ``+`` reduction deep-copies per pair and re-reads every field
+        from both sides; one loop with a plain accumulator dict keeps the
+        cost at a single pass. None entries are skipped, fields missing
+        everywhere stay None.
+
+        Args:
+            items: HDC readings to fold together; None entries are skipped
+
+        Returns:
+            Summed reading, or None if no non-None items were given
+
+        """
+        acc: dict[str, int | None] = dict.fromkeys(
+            (
+                "ev_time",
+                "ev_distance",
+                "charge_time",
+                "charge_dist",
+                "eco_time",
+                "eco_dist",
+                "power_time",
+                "power_dist",
+            )
+        )
+        seen = False
+        for item in items:
+            if item is None:
+                continue
+            seen = True
+            for key, val in acc.items():
+                acc[key] = add_with_none(val, getattr(item, key))
+        return cls.model_construct(**acc) if seen else None
 
 
 class _RouteModel(CustomEndpointBaseModel):
@@ -155,9 +240,184 @@ class _RouteModel(CustomEndpointBaseModel):
     lon: float | None
     overspeed: bool | None
     highway: bool | None
-    index_in_points: int | None = Field(alias="indexInPoints")
+    index_in_points: int | None
     mode: int | None = None
-    is_ev: bool | None = Field(alias="isEv")
+    is_ev: bool | None
+
+
+# Sentinel for nullable int columns: routes can hold thousands of points,
+# so columns beat one pydantic model per point, but typed arrays cannot
+# hold None directly. int64 minimum is outside anything the API can send,
+# so legitimate values (including -1) round-trip intact.
+_INT_NONE = -(2**63)
+
+# One flags byte per point: bits 0-2 carry overspeed/highway/isEv, bits 3-5
+# mark the same field as missing (tri-state without a second column), and
+# bits 6-7 mark lat/lon as missing so a null coordinate does not read back
+# as 0.0 on the equator/prime meridian.
+_FLAG_BITS = ((1, 8), (2, 16), (4, 32))
+_LAT_NONE_BIT = 64
+_LON_NONE_BIT = 128
+
+
+class RouteArray:
+    """Columnar storage for a trip route.
+
+    Each column holds one field for every point (structure-of-arrays).
+    Coordinates are quantized to int32 fixed-point at 1e-7 degrees - the
+    useful GPS precision, ~1.1cm at the equator - which halves their
+    footprint versus doubles; the three booleans share a single flags
+    byte. Iteration and indexing materialise a ``_RouteModel`` per point
+    on demand, so callers that walk the route keep their attribute access
+    while bulk consumers can read the columns directly.
+    """
+
+    __slots__ = ("flags", "index_in_points", "lat_e7", "lon_e7", "mode")
+
+    def __init__(self, points: list[dict[str, Any]]) -> None:
+        """Build the columns from raw route point dicts.
+
+        Args:
+            points: Route points as decoded from the API payload
+
+        """
+        n = len(points)
+        self.lat_e7 = array("i", bytes(4 * n))
+        self.lon_e7 = array("i", bytes(4 * n))
+        self.flags = bytearray(n)
+        self.index_in_points = array("q", bytes(8 * n))
+        self.mode = array("q", bytes(8 * n))
+        for i, pt in enumerate(points):
+            flags = 0
+            lat = pt.get("lat")
+            if lat is None:
+                flags |= _LAT_NONE_BIT
+            else:
+                self.lat_e7[i] = round(lat * 1e7)
+            lon = pt.get("lon")
+            if lon is None:
+                flags |= _LON_NONE_BIT
+            else:
+                self.lon_e7[i] = round(lon * 1e7)
+            # Like populate_by_name on the models, accept both the wire
+            # (camelCase) and field-name spellings so serialized points
+            # re-validate losslessly.
+            for (key, alt), (value_bit, none_bit) in zip(
+                (("overspeed",) * 2, ("highway",) * 2, ("isEv", "is_ev")),
+                _FLAG_BITS,
+                strict=True,
+            ):
+                v = pt.get(key)
+                if v is None:
+                    v = pt.get(alt)
+                if v is None:
+                    flags |= none_bit
+                elif v:
+                    flags |= value_bit
+            self.flags[i] = flags
+            for col, key, alt in (
+                (self.index_in_points, "indexInPoints", "index_in_points"),
+                (self.mode, "mode", "mode"),
+            ):
+                v = pt.get(key)
+                if v is None:
+                    v = pt.get(alt)
+                col[i] = _INT_NONE if v is None else v
+
+    @property
+    def lat(self) -> array:
+        """Latitudes as doubles, dequantized lazily for bulk consumers.
+
+        Missing coordinates surface as nan; typed arrays cannot hold None.
+        """
+        return array(
+            "d",
+            (
+                nan if f & _LAT_NONE_BIT else v / 1e7
+                for v, f in zip(self.lat_e7, self.flags, strict=True)
+            ),
+        )
+
+    @property
+    def lon(self) -> array:
+        """Longitudes as doubles, dequantized lazily for bulk consumers.
+
+        Missing coordinates surface as nan; typed arrays cannot hold None.
+        """
+        return array(
+            "d",
+            (
+                nan if f & _LON_NONE_BIT else v / 1e7
+                for v, f in zip(self.lon_e7, self.flags, strict=True)
+            ),
+        )
+
+    def __len__(self) -> int:
+        """Number of route points."""
+        return len(self.lat_e7)
+
+    def __getitem__(self, i: int | slice) -> _RouteModel | list[_RouteModel]:
+        """Materialise point ``i``, or a slice of points, as ``_RouteModel``s."""
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        flags = self.flags[i]
+        overspeed, highway, is_ev = (
+            None if flags & none_bit else bool(flags & value_bit)
+            for value_bit, none_bit in _FLAG_BITS
+        )
+        ints = (
+            None if col[i] == _INT_NONE else col[i]
+            for col in (self.index_in_points, self.mode)
+        )
+        index_in_points, mode = ints
+        return _RouteModel.model_construct(
+            lat=None if flags & _LAT_NONE_BIT else self.lat_e7[i] / 1e7,
+            lon=None if flags & _LON_NONE_BIT else self.lon_e7[i] / 1e7,
+            overspeed=overspeed,
+            highway=highway,
+            index_in_points=index_in_points,
+            mode=mode,
+            is_ev=is_ev,
+        )
+
+    def __iter__(self) -> Iterator[_RouteModel]:
+        """Iterate the points, materialising models lazily."""
+        return (self[i] for i in range(len(self)))
+
+    def __eq__(self, other: object) -> bool:
+        """Column-wise equality with another RouteArray."""
+        if not isinstance(other, RouteArray):
+            return NotImplemented
+        return all(getattr(self, col) == getattr(other, col) for col in self.__slots__)
+
+    def __hash__(self) -> int:
+        """Hash on the coordinate columns."""
+        return hash((self.lat_e7.tobytes(), self.lon_e7.tobytes()))
+
+    @classmethod
+    def _validate(cls, v: Any) -> RouteArray:  # noqa : ANN401
+        if isinstance(v, cls):
+            return v
+        return cls(v)
+
+    @staticmethod
+    def _serialize(v: RouteArray) -> list[dict[str, Any]]:
+        return [pt.model_dump() for pt in v]
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls,
+        source_type: Any,  # noqa : ANN401
+        handler: GetCoreSchemaHandler,
+    ) -> core_schema.CoreSchema:
+        """Validate from point lists, serialize back to point dicts."""
+        del source_type, handler
+        return core_schema.no_info_plain_validator_function(
+            cls._validate,
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                cls._serialize
+            ),
+        )
 
 
 class _TripModel(CustomEndpointBaseModel):
@@ -167,7 +427,7 @@ class _TripModel(CustomEndpointBaseModel):
     scores: _ScoresModel | None = None
     behaviours: list[_BehaviourModel] | None = None
     hdc: _HDCModel | None = None
-    route: list[_RouteModel] | None = None
+    route: RouteArray | None = None
 
 
 class _HistogramModel(CustomEndpointBaseModel):
@@ -188,24 +448,26 @@ class _SummaryItemModel(CustomEndpointBaseModel):
     histograms: list[_HistogramModel]
 
 
-class _PaginationModel(CustomEndpointBaseModel):
+class _PaginationModel(TypedDict):
+    __pydantic_config__ = ConfigDict(populate_by_name=True)  # type: ignore[misc]
+
     limit: int | None
     offset: int | None
-    previous_offset: Any | None = Field(alias="previousOffset", default=None)
-    next_offset: int | None = Field(alias="nextOffset", default=None)
-    current_page: int | None = Field(alias="currentPage")
-    total_count: int | None = Field(alias="totalCount")
-    page_count: int | None = Field(alias="pageCount")
+    previous_offset: NotRequired[Annotated[Any, Field(alias="previousOffset")]]
+    next_offset: NotRequired[Annotated[int | None, Field(alias="nextOffset")]]
+    current_page: Annotated[int | None, Field(alias="currentPage")]
+    total_count: Annotated[int | None, Field(alias="totalCount")]
+    page_count: Annotated[int | None, Field(alias="pageCount")]
 
 
-class _SortedByItemModel(CustomEndpointBaseModel):
+class _SortedByItemModel(TypedDict):
     field: str | None
     order: str | None
 
 
 class _MetadataModel(CustomEndpointBaseModel):
     pagination: _PaginationModel | None
-    sorted_by: list[_SortedByItemModel] | None = Field(alias="sortedBy")
+    sorted_by: list[_SortedByItemModel] | None
 
 
 class TripsModel(CustomEndpointBaseModel):
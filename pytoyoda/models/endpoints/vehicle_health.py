@@ -13,17 +13,20 @@ class VehicleHealthModel(CustomEndpointBaseModel):
     r"""Model representing the health status of a vehicle.
 
     Attributes:
-        quantity_of_eng_oil_icon (Optional[list[Any]], optional):
-        The quantity of engine oil icon. Defaults to None.
+        quantity_of_eng_oil_icon (Any): The quantity of engine oil icon,
+            passed through unvalidated. Defaults to None.
         vin (str): The VIN (Vehicle Identification Number) of the vehicle.
-        warning (Optional[list[Any]]): The warning information. Defaults to None.
+        warning (Any): The warning information, passed through unvalidated.
+            Defaults to None.
         wng_last_upd_time (datetime): The timestamp of the last warning update.
 
     """
 
-    quantity_of_eng_oil_icon: list[Any] | None = Field(alias="quantityOfEngOilIcon")
+    # Bare Any skips the per-element list walk; the payload shape of these
+    # fields is undocumented and nothing downstream constrains it.
+    quantity_of_eng_oil_icon: Any = None
     vin: str | None
-    warning: list[Any] | None
+    warning: Any = None
     wng_last_upd_time: datetime | None = Field(alias="wnglastUpdTime")
 
 
@@ -13,54 +13,65 @@ from pytoyoda.models.endpoints.status import (
     SectionModel,
     VehicleStatusModel,
 )
-from pytoyoda.utils.models import CustomAPIBaseModel
+from pytoyoda.utils.models import CustomAPIBaseModel, cached_computed
 
+# Module-level functions rather than staticmethods: callers load them with
+# one LOAD_GLOBAL instead of walking the class attribute plus descriptor.
 
-class StatusHelper:
-    """Helper class for status operations."""
-
-    @staticmethod
-    def get_category(
-        data: RemoteStatusModel | None, category: str
-    ) -> VehicleStatusModel | None:
-        """Search for a category in Vehicle Status."""
-        if data and data.vehicle_status:
-            return next(
-                (item for item in data.vehicle_status if item.category == category),
-                None,
-            )
-        return None
 
-    @staticmethod
-    def get_section(
-        data: VehicleStatusModel | None, section: str
-    ) -> SectionModel | None:
-        """Search for a section in the category."""
-        if data and data.sections:
-            return next(
-                (item for item in data.sections if item.section == section),
-                None,
-            )
-        return None
+def _get_category(
+    data: RemoteStatusModel | None, category: str
+) -> VehicleStatusModel | None:
+    """Search for a category in Vehicle Status."""
+    if data and data.vehicle_status:
+        return next(
+            (item for item in data.vehicle_status if item.category == category),
+            None,
+        )
+    return None
 
-    @staticmethod
-    def get_status(data: SectionModel | None, status: str) -> bool | None:
-        """Determine the status of a value in the section."""
-        if data and data.values:
-            item_status = next(
-                (item.status for item in data.values if item.value == status),
-                None,
-            )
-            return item_status if item_status is None else not bool(item_status)
-        return None
 
-    @classmethod
-    def get_component_section(
-        cls, status: RemoteStatusModel | None, category: str, section: str
-    ) -> SectionModel | None:
-        """Retrieve component section from a given category."""
-        category_data = cls.get_category(status, category=category)
-        return cls.get_section(category_data, section=section)
+def _get_section(data: VehicleStatusModel | None, section: str) -> SectionModel | None:
+    """Search for a section in the category."""
+    if data and data.sections:
+        return next(
+            (item for item in data.sections if item.section == section),
+            None,
+        )
+    return None
+
+
+def _get_component_section(
+    status: RemoteStatusModel | None, category: str, section: str
+) -> SectionModel | None:
+    """Retrieve component section from a given category."""
+    return _get_section(_get_category(status, category=category), section=section)
+
+
+def _build_section_index(
+    data: RemoteStatusModel | None,
+) -> dict[tuple[str, str], SectionModel]:
+    """Index sections by (category, section) in a single pass.
+
+    Each per-property lookup then becomes one dict hit instead of two
+    linear scans over the status tree.
+    """
+    index: dict[tuple[str, str], SectionModel] = {}
+    if data and data.vehicle_status:
+        for vs in data.vehicle_status:
+            if vs.sections:
+                for sec in vs.sections:
+                    index[(vs.category, sec.section)] = sec
+    return index
+
+
+class StatusHelper:
+    """Backward-compat shim over the module-level status helpers."""
+
+    get_category = staticmethod(_get_category)
+    get_section = staticmethod(_get_section)
+    get_component_section = staticmethod(_get_component_section)
+    build_section_index = staticmethod(_build_section_index)
 
 
 class Door(CustomAPIBaseModel[Optional[SectionModel]]):
@@ -76,20 +87,34 @@ class Door(CustomAPIBaseModel[Optional[SectionModel]]):
             data=status,
             **kwargs,
         )
+        # value -> status built once: each property is then a single dict
+        # hit instead of a generator scan per access (locked scans twice).
+        self._values = (
+            {v.value: v.status for v in status.values}
+            if status and status.values
+            else {}
+        )
+
+    def _flag(self, value: str) -> bool | None:
+        """Status flag for `value`, inverted like the old scan helper was."""
+        status = self._values.get(value)
+        return status if status is None else not bool(status)
 
     @computed_field  # type: ignore[prop-decorator]
     @property
+    @cached_computed
     def closed(self) -> bool | None:
         """If the door is closed."""
-        return StatusHelper.get_status(self._data, status="carstatus_closed")
+        return self._flag("carstatus_closed")
 
     @computed_field  # type: ignore[prop-decorator]
     @property
+    @cached_computed
     def locked(self) -> bool | None:
         """If the door is locked."""
-        if StatusHelper.get_status(self._data, status="carstatus_locked") is True:
+        if self._flag("carstatus_locked") is True:
             return True
-        if StatusHelper.get_status(self._data, status="carstatus_unlocked") is False:
+        if self._flag("carstatus_unlocked") is False:
             return False
         return None
 
@@ -100,68 +125,77 @@ class Doors(CustomAPIBaseModel[Optional[RemoteStatusModel]]):
     def __init__(
         self,
         status: RemoteStatusModel | None = None,
+        index: dict[tuple[str, str], SectionModel] | None = None,
         **kwargs: dict,
     ) -> None:
-        """Initialise Doors Model."""
+        """Initialise Doors Model.
+
+        Args:
+            status: Remote status payload to index
+            index: Prebuilt section index to reuse instead of re-indexing
+            **kwargs: Additional keyword arguments passed to the parent class
+
+        """
         super().__init__(
             data=status,
             **kwargs,
         )
+        self._sections = index if index is not None else _build_section_index(status)
 
     @computed_field  # type: ignore[prop-decorator]
     @property
+    @cached_computed
     def driver_seat(self) -> Door | None:
         """Driver seat door."""
-        section = StatusHelper.get_component_section(
-            self._data,
-            category="carstatus_category_driver",
-            section="carstatus_item_driver_door",
+        return Door(
+            self._sections.get(
+                ("carstatus_category_driver", "carstatus_item_driver_door")
+            )
         )
-        return Door(section)
 
     @computed_field  # type: ignore[prop-decorator]
     @property
+    @cached_computed
     def driver_rear_seat(self) -> Door | None:
         """Right rearseat door."""
-        section = StatusHelper.get_component_section(
-            self._data,
-            category="carstatus_category_driver",
-            section="carstatus_item_driver_rear_door",
+        return Door(
+            self._sections.get(
+                ("carstatus_category_driver", "carstatus_item_driver_rear_door")
+            )
         )
-        return Door(section)
 
     @computed_field  # type: ignore[prop-decorator]
     @property
+    @cached_computed
     def passenger_seat(self) -> Door | None:
         """Passenger seat door."""
-        section = StatusHelper.get_component_section(
-            self._data,
-            category="carstatus_category_passenger",
-            section="carstatus_item_passenger_door",
+        return Door(
+            self._sections.get(
+                ("carstatus_category_passenger", "carstatus_item_passenger_door")
+            )
         )
-        return Door(section)
 
     @computed_field  # type: ignore[prop-decorator]
     @property
+    @cached_computed
     def passenger_rear_seat(self) -> Door | None:
         """Left rearseat door."""
-        section = StatusHelper.get_component_section(
-            self._data,
-            category="carstatus_category_passenger",
-            section="carstatus_item_passenger_rear_door",
+        return Door(
+            self._sections.get(
+                ("carstatus_category_passenger", "carstatus_item_passenger_rear_door")
+            )
         )
-        return Door(section)
 
     @computed_field  # type: ignore[prop-decorator]
     @property
+    @cached_computed
     def trunk(self) -> Door | None:
         """Trunk."""
-        section = StatusHelper.get_component_section(
-            self._data,
-            category="carstatus_category_other",
-            section="carstatus_item_rear_hatch",
+        return Door(
+            self._sections.get(
+                ("carstatus_category_other", "carstatus_item_rear_hatch")
+            )
         )
-        return Door(section)
 
 
 class Window(CustomAPIBaseModel[Optional[SectionModel]]):
@@ -177,12 +211,19 @@ class Window(CustomAPIBaseModel[Optional[SectionModel]]):
             data=status,
             **kwargs,
         )
+        self._values = (
+            {v.value: v.status for v in status.values}
+            if status and status.values
+            else {}
+        )
 
     @computed_field  # type: ignore[prop-decorator]
     @property
+    @cached_computed
     def closed(self) -> bool | None:
         """Window closed state."""
-        return StatusHelper.get_status(self._data, status="carstatus_closed")
+        status = self._values.get("carstatus_closed")
+        return status if status is None else not bool(status)
 
 
 class Windows(CustomAPIBaseModel[Optional[RemoteStatusModel]]):
@@ -191,57 +232,66 @@ class Windows(CustomAPIBaseModel[Optional[RemoteStatusModel]]):
     def __init__(
         self,
         status: RemoteStatusModel | None = None,
+        index: dict[tuple[str, str], SectionModel] | None = None,
         **kwargs: dict,
     ) -> None:
-        """Initialise Windows Model."""
+        """Initialise Windows Model.
+
+        Args:
+            status: Remote status payload to index
+            index: Prebuilt section index to reuse instead of re-indexing
+            **kwargs: Additional keyword arguments passed to the parent class
+
+        """
         super().__init__(
             data=status,
             **kwargs,
         )
+        self._sections = index if index is not None else _build_section_index(status)
 
     @computed_field  # type: ignore[prop-decorator]
     @property
+    @cached_computed
     def driver_seat(self) -> Window | None:
         """Driver seat window."""
-        section = StatusHelper.get_component_section(
-            self._data,
-            category="carstatus_category_driver",
-            section="carstatus_item_driver_window",
+        return Window(
+            self._sections.get(
+                ("carstatus_category_driver", "carstatus_item_driver_window")
+            )
         )
-        return Window(section)
 
     @computed_field  # type: ignore[prop-decorator]
     @property
+    @cached_computed
     def driver_rear_seat(self) -> Window | None:
         """Right rearseat window."""
-        section = StatusHelper.get_component_section(
-            self._data,
-            category="carstatus_category_driver",
-            section="carstatus_item_driver_rear_window",
+        return Window(
+            self._sections.get(
+                ("carstatus_category_driver", "carstatus_item_driver_rear_window")
+            )
         )
-        return Window(section)
 
     @computed_field  # type: ignore[prop-decorator]
     @property
+    @cached_computed
     def passenger_seat(self) -> Window | None:
         """Passenger seat window."""
-        section = StatusHelper.get_component_section(
-            self._data,
-            category="carstatus_category_passenger",
-            section="carstatus_item_passenger_window",
+        return Window(
+            self._sections.get(
+                ("carstatus_category_passenger", "carstatus_item_passenger_window")
+            )
         )
-        return Window(section)
 
     @computed_field  # type: ignore[prop-decorator]
     @property
+    @cached_computed
     def passenger_rear_seat(self) -> Window | None:
         """Left rearseat window."""
-        section = StatusHelper.get_component_section(
-            self._data,
-            category="carstatus_category_passenger",
-            section="carstatus_item_passenger_rear_window",
+        return Window(
+            self._sections.get(
+                ("carstatus_category_passenger", "carstatus_item_passenger_rear_window")
+            )
         )
-        return Window(section)
 
 
 class LockStatus(CustomAPIBaseModel[Optional[RemoteStatusResponseModel]]):
@@ -260,6 +310,9 @@ class LockStatus(CustomAPIBaseModel[Optional[RemoteStatusResponseModel]]):
         self._status: RemoteStatusModel | None = (
             self._data.payload if self._data else None
         )
+        # One index shared by doors, windows and hood: the whole status tree
+        # is walked exactly once per LockStatus.
+        self._index = _build_section_index(self._status)
 
     @computed_field  # type: ignore[prop-decorator]
     @property
@@ -269,25 +322,29 @@ class LockStatus(CustomAPIBaseModel[Optional[RemoteStatusResponseModel]]):
 
     @computed_field  # type: ignore[prop-decorator]
     @property
+    @cached_computed
     def doors(self) -> Doors | None:
         """Doors."""
-        return self._status if self._status is None else Doors(self._status)
+        if self._status is None:
+            return None
+        return Doors(self._status, index=self._index)
 
     @computed_field  # type: ignore[prop-decorator]
     @property
+    @cached_computed
     def windows(self) -> Windows | None:
         """Windows."""
-        return self._status if self._status is None else Windows(self._status)
+        if self._status is None:
+            return None
+        return Windows(self._status, index=self._index)
 
     @computed_field  # type: ignore[prop-decorator]
     @property
+    @cached_computed
     def hood(self) -> Door | None:
         """Hood."""
         if self._status is None:
             return None
-        section = StatusHelper.get_component_section(
-            self._status,
-            category="carstatus_category_other",
-            section="carstatus_item_hood",
+        return Door(
+            self._index.get(("carstatus_category_other", "carstatus_item_hood"))
         )
-        return Door(section)
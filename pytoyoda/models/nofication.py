@@ -2,8 +2,6 @@
 
 from datetime import datetime
 
-from pydantic import computed_field
-
 from pytoyoda.models.endpoints.notifications import NotificationModel
 from pytoyoda.utils.models import CustomAPIBaseModel
 
@@ -11,6 +9,16 @@ from pytoyoda.utils.models import CustomAPIBaseModel
 class Notification(CustomAPIBaseModel[NotificationModel]):
     """Notification."""
 
+    # Plain forwarders of payload attributes are real fields snapshotted in
+    # __init__ rather than computed_fields: pydantic-core then serializes
+    # them on its fast attribute path instead of invoking a Python property
+    # getter per field per notification on every model_dump.
+    category: str | None = None
+    read: datetime | None = None
+    message: str | None = None
+    type: str | None = None
+    date: datetime | None = None
+
     def __init__(self, notification: NotificationModel, **kwargs: dict) -> None:
         """Initialize Notification model.
 
@@ -24,62 +32,8 @@ class Notification(CustomAPIBaseModel[NotificationModel]):
             data=notification,
             **kwargs,
         )
-
-    @computed_field  # type: ignore[prop-decorator]
-    @property
-    def category(self) -> str | None:
-        """Category of notification.
-
-        For example, ChargingAlert, RemoteCommand
-
-        Returns:
-            str: Category of notification
-
-        """
-        return self._data.category
-
-    @computed_field  # type: ignore[prop-decorator]
-    @property
-    def read(self) -> datetime | None:
-        """Notification has been read.
-
-        Returns:
-            datetime: Time notification read. None if not read.
-
-        """
-        return self._data.read_timestamp
-
-    @computed_field  # type: ignore[prop-decorator]
-    @property
-    def message(self) -> str | None:
-        """Notification message.
-
-        Returns:
-            str: Notification message
-
-        """
-        return self._data.message
-
-    @computed_field  # type: ignore[prop-decorator]
-    @property
-    def type(self) -> str | None:
-        """Type.
-
-        For example, Alert
-
-        Returns:
-            str: Notification type
-
-        """
-        return self._data.type
-
-    @computed_field  # type: ignore[prop-decorator]
-    @property
-    def date(self) -> datetime | None:
-        """Notification Date.
-
-        Returns:
-            datetime: Time of notification
-
-        """
-        return self._data.notification_date
+        self.category = notification.category
+        self.read = notification.read_timestamp
+        self.message = notification.message
+        self.type = notification.type
+        self.date = notification.notification_date
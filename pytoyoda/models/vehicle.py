@@ -1,13 +1,11 @@
 """Vehicle model."""
 
-import copy
-import json
-from collections.abc import Callable
-from dataclasses import dataclass
+import asyncio
+from collections.abc import AsyncIterator, Callable
 from datetime import date, timedelta
 from enum import Enum, auto
 from functools import partial
-from itertools import groupby
+from itertools import chain
 from operator import attrgetter
 from typing import Any, TypeVar
 
@@ -20,14 +18,19 @@ from pytoyoda.exceptions import ToyotaApiError
 from pytoyoda.models.climate import ClimateSettings, ClimateStatus
 from pytoyoda.models.dashboard import Dashboard
 from pytoyoda.models.electric_status import ElectricStatus
-from pytoyoda.models.endpoints.command import CommandType
+from pytoyoda.models.endpoints.command import CommandLiteral
 from pytoyoda.models.endpoints.common import StatusModel
 from pytoyoda.models.endpoints.electric import (
     ElectricCommandResponseModel,
     NextChargeSettings,
 )
 from pytoyoda.models.endpoints.refresh_status import RefreshStatusResponseModel
-from pytoyoda.models.endpoints.trips import _SummaryItemModel
+from pytoyoda.models.endpoints.trips import (
+    _HDCModel,
+    _HistogramModel,
+    _SummaryBaseModel,
+    _SummaryItemModel,
+)
 from pytoyoda.models.endpoints.vehicle_guid import VehicleGuidModel
 from pytoyoda.models.location import Location
 from pytoyoda.models.lock_status import LockStatus
@@ -35,15 +38,99 @@ from pytoyoda.models.nofication import Notification
 from pytoyoda.models.service_history import ServiceHistory
 from pytoyoda.models.summary import Summary, SummaryType
 from pytoyoda.models.trips import Trip
-from pytoyoda.utils.helpers import add_with_none
 from pytoyoda.utils.log_utils import censor_all
-from pytoyoda.utils.models import CustomAPIBaseModel
+from pytoyoda.utils.models import CustomAPIBaseModel, cached_computed
 
 T = TypeVar(
     "T",
     bound=Api | VehicleGuidModel | bool,
 )
 
+# Pages of trip data fetched in flight at once. Kept deliberately small:
+# the gateway 429s on bursts of near-simultaneous requests (see the
+# Vehicle.update docstring), and a handful of concurrent page fetches stays
+# well under the burst size that trips it.
+_TRIPS_FETCH_CONCURRENCY = 3
+
+
+def _trip_history_kwargs() -> dict[str, Any]:
+    """Date-dependent arguments for the trip_history endpoint fetch.
+
+    Evaluated at Vehicle construction so the 90-day window is anchored to
+    the day the Vehicle is built, as before.
+    """
+    today = date.today()  # noqa: DTZ011
+    return {
+        "from_date": today - timedelta(days=90),
+        "to_date": today,
+        "summary": True,
+        "limit": 1,
+        "offset": 0,
+        "route": False,
+    }
+
+
+# Endpoint table shared by every Vehicle: (endpoint name, capability
+# predicate over (extended_capabilities, features) or None when always
+# available, Api method name, extra-kwargs factory or None). Built once at
+# import so Vehicle.__init__ only binds partials for the capable endpoints
+# instead of re-creating all ten entries per instantiation. Module-level
+# rather than a class attribute because pydantic would otherwise collect
+# the underscore name as a private attr.
+_ENDPOINT_SPEC: tuple[
+    tuple[str, Callable[[Any, Any], bool] | None, str, Callable[[], dict] | None],
+    ...,
+] = (
+    (
+        "location",
+        lambda ext, features: (
+            getattr(ext, "last_parked_capable", False)
+            or getattr(features, "last_parked", False)
+        ),
+        "get_location",
+        None,
+    ),
+    ("health_status", None, "get_vehicle_health_status", None),
+    (
+        "electric_status",
+        lambda ext, _features: getattr(ext, "econnect_vehicle_status_capable", False),
+        "get_vehicle_electric_status",
+        None,
+    ),
+    (
+        "telemetry",
+        lambda ext, _features: getattr(ext, "telemetry_capable", False),
+        "get_telemetry",
+        None,
+    ),
+    ("notifications", None, "get_notifications", None),
+    (
+        "status",
+        lambda ext, _features: getattr(ext, "vehicle_status", False),
+        "get_remote_status",
+        None,
+    ),
+    (
+        "service_history",
+        lambda _ext, features: getattr(features, "service_history", False),
+        "get_service_history",
+        None,
+    ),
+    (
+        "climate_settings",
+        lambda _ext, features: getattr(features, "climate_start_engine", False),
+        "get_climate_settings",
+        None,
+    ),
+    (
+        "climate_status",
+        lambda _ext, features: getattr(features, "climate_start_engine", False),
+        "get_climate_status",
+        None,
+    ),
+    ("trip_history", None, "get_trips", _trip_history_kwargs),
+)
+
 
 class VehicleType(Enum):
     """Vehicle types."""
@@ -79,15 +166,6 @@ class VehicleType(Enum):
             return vehicle_type
 
 
-@dataclass
-class EndpointDefinition:
-    """Definition of an API endpoint."""
-
-    name: str
-    capable: bool
-    function: Callable
-
-
 class Vehicle(CustomAPIBaseModel[type[T]]):
     """Vehicle data representation."""
 
@@ -110,123 +188,23 @@ class Vehicle(CustomAPIBaseModel[type[T]]):
         self._metric = metric
         self._endpoint_data: dict[str, Any] = {}
 
-        if self._vehicle_info.vin:
-            self._api_endpoints: list[EndpointDefinition] = [
-                EndpointDefinition(
-                    name="location",
-                    capable=(
-                        getattr(
-                            getattr(self._vehicle_info, "extended_capabilities", False),
-                            "last_parked_capable",
-                            False,
-                        )
-                        or getattr(
-                            getattr(self._vehicle_info, "features", False),
-                            "last_parked",
-                            False,
-                        )
-                    ),
-                    function=partial(
-                        self._api.get_location, vin=self._vehicle_info.vin
-                    ),
-                ),
-                EndpointDefinition(
-                    name="health_status",
-                    capable=True,
-                    function=partial(
-                        self._api.get_vehicle_health_status,
-                        vin=self._vehicle_info.vin,
-                    ),
-                ),
-                EndpointDefinition(
-                    name="electric_status",
-                    capable=getattr(
-                        getattr(self._vehicle_info, "extended_capabilities", False),
-                        "econnect_vehicle_status_capable",
-                        False,
-                    ),
-                    function=partial(
-                        self._api.get_vehicle_electric_status,
-                        vin=self._vehicle_info.vin,
-                    ),
-                ),
-                EndpointDefinition(
-                    name="telemetry",
-                    capable=getattr(
-                        getattr(self._vehicle_info, "extended_capabilities", False),
-                        "telemetry_capable",
-                        False,
-                    ),
-                    function=partial(
-                        self._api.get_telemetry, vin=self._vehicle_info.vin
-                    ),
-                ),
-                EndpointDefinition(
-                    name="notifications",
-                    capable=True,
-                    function=partial(
-                        self._api.get_notifications, vin=self._vehicle_info.vin
-                    ),
-                ),
-                EndpointDefinition(
-                    name="status",
-                    capable=getattr(
-                        getattr(self._vehicle_info, "extended_capabilities", False),
-                        "vehicle_status",
-                        False,
-                    ),
-                    function=partial(
-                        self._api.get_remote_status, vin=self._vehicle_info.vin
-                    ),
-                ),
-                EndpointDefinition(
-                    name="service_history",
-                    capable=getattr(
-                        getattr(self._vehicle_info, "features", False),
-                        "service_history",
-                        False,
-                    ),
-                    function=partial(
-                        self._api.get_service_history, vin=self._vehicle_info.vin
-                    ),
-                ),
-                EndpointDefinition(
-                    name="climate_settings",
-                    capable=getattr(
-                        getattr(self._vehicle_info, "features", False),
-                        "climate_start_engine",
-                        False,
-                    ),
-                    function=partial(
-                        self._api.get_climate_settings, vin=self._vehicle_info.vin
-                    ),
-                ),
-                EndpointDefinition(
-                    name="climate_status",
-                    capable=getattr(
-                        getattr(self._vehicle_info, "features", False),
-                        "climate_start_engine",
-                        False,
-                    ),
-                    function=partial(
-                        self._api.get_climate_status, vin=self._vehicle_info.vin
-                    ),
-                ),
-                EndpointDefinition(
-                    name="trip_history",
-                    capable=True,
-                    function=partial(
-                        self._api.get_trips,
-                        vin=self._vehicle_info.vin,
-                        from_date=(date.today() - timedelta(days=90)),  # noqa: DTZ011
-                        to_date=date.today(),  # noqa: DTZ011
-                        summary=True,
-                        limit=1,
-                        offset=0,
-                        route=False,
-                    ),
-                ),
-            ]
+        if vehicle_info.vin:
+            # The endpoint metadata lives in the module-level _ENDPOINT_SPEC
+            # table; construction only evaluates the capability predicates
+            # and binds partials for the endpoints this car supports.
+            vin = vehicle_info.vin
+            ext = getattr(vehicle_info, "extended_capabilities", False)
+            features = getattr(vehicle_info, "features", False)
+            self._endpoint_collect = tuple(
+                (
+                    name,
+                    partial(getattr(api, method), vin=vin)
+                    if extra_kwargs is None
+                    else partial(getattr(api, method), vin=vin, **extra_kwargs()),
+                )
+                for name, capable, method, extra_kwargs in _ENDPOINT_SPEC
+                if capable is None or capable(ext, features)
+            )
         else:
             raise ToyotaApiError(
                 logger.error(
@@ -234,11 +212,6 @@ class Vehicle(CustomAPIBaseModel[type[T]]):
                     "required for the end point request could not be determined"
                 )
             )
-        self._endpoint_collect = [
-            (endpoint.name, endpoint.function)
-            for endpoint in self._api_endpoints
-            if endpoint.capable
-        ]
 
     async def update(
         self,
@@ -255,7 +228,7 @@ class Vehicle(CustomAPIBaseModel[type[T]]):
         succeed cleanly. See pytoyoda/ha_toyota#282 for measurement evidence.
 
         Args:
-            skip: Endpoint names (matching EndpointDefinition.name values
+            skip: Endpoint names (matching the endpoint-table names
                 like "status", "telemetry", etc.) to skip this cycle.
                 Skipped endpoints retain their previous _endpoint_data
                 entry, so consumers continue to see the last-known value.
@@ -287,6 +260,11 @@ class Vehicle(CustomAPIBaseModel[type[T]]):
                 continue
             self._endpoint_data[name] = await function()
 
+        # Wrapper objects built from _endpoint_data are memoized per refresh
+        # cycle (cached_computed); drop them so the next read rebuilds from
+        # the fresh payloads.
+        self._computed_cache = {}
+
     @computed_field  # type: ignore[prop-decorator]
     @property
     def vin(self) -> str | None:
@@ -311,9 +289,13 @@ class Vehicle(CustomAPIBaseModel[type[T]]):
 
     @computed_field  # type: ignore[prop-decorator]
     @property
+    @cached_computed
     def type(self) -> str | None:
         """Returns the "type" of vehicle.
 
+        The classification depends only on _vehicle_info, which is fixed at
+        construction, so the derivation runs at most once per refresh.
+
         Returns:
             Optional[str]: "fuel" if only fuel based
                 "mildhybrid" if hybrid
@@ -326,6 +308,7 @@ class Vehicle(CustomAPIBaseModel[type[T]]):
 
     @computed_field  # type: ignore[prop-decorator]
     @property
+    @cached_computed
     def dashboard(self) -> Dashboard | None:
         """Returns the Vehicle dashboard.
 
@@ -346,6 +329,7 @@ class Vehicle(CustomAPIBaseModel[type[T]]):
 
     @computed_field  # type: ignore[prop-decorator]
     @property
+    @cached_computed
     def climate_settings(self) -> ClimateSettings | None:
         """Return the vehicle climate settings.
 
@@ -357,6 +341,7 @@ class Vehicle(CustomAPIBaseModel[type[T]]):
 
     @computed_field  # type: ignore[prop-decorator]
     @property
+    @cached_computed
     def climate_status(self) -> ClimateStatus | None:
         """Return the vehicle climate status.
 
@@ -368,6 +353,7 @@ class Vehicle(CustomAPIBaseModel[type[T]]):
 
     @computed_field  # type: ignore[prop-decorator]
     @property
+    @cached_computed
     def electric_status(self) -> ElectricStatus | None:
         """Returns the Electric Status of the vehicle.
 
@@ -410,6 +396,7 @@ class Vehicle(CustomAPIBaseModel[type[T]]):
 
     @computed_field  # type: ignore[prop-decorator]
     @property
+    @cached_computed
     def location(self) -> Location | None:
         """Return the vehicles latest reported Location.
 
@@ -424,6 +411,7 @@ class Vehicle(CustomAPIBaseModel[type[T]]):
 
     @computed_field  # type: ignore[prop-decorator]
     @property
+    @cached_computed
     def notifications(self) -> list[Notification] | None:
         r"""Returns a list of notifications for the vehicle.
 
@@ -432,16 +420,22 @@ class Vehicle(CustomAPIBaseModel[type[T]]):
                 or None if not supported.
 
         """
-        if "notifications" in self._endpoint_data:
-            ret: list[Notification] = []
-            for p in self._endpoint_data["notifications"].payload:
-                ret.extend(Notification(n) for n in p.notifications)
-            return ret
+        notifications = self._endpoint_data.get("notifications")
+        if notifications is not None:
+            # map + chain keep the per-item iteration in C; only the
+            # Notification constructor itself runs Python per element.
+            return list(
+                map(
+                    Notification,
+                    chain.from_iterable(p.notifications for p in notifications.payload),
+                )
+            )
 
         return None
 
     @computed_field  # type: ignore[prop-decorator]
     @property
+    @cached_computed
     def service_history(self) -> list[ServiceHistory] | None:
         r"""Returns a list of service history entries for the vehicle.
 
@@ -450,16 +444,12 @@ class Vehicle(CustomAPIBaseModel[type[T]]):
                 for the vehicle, or None if not supported.
 
         """
-        if "service_history" in self._endpoint_data:
-            ret: list[ServiceHistory] = []
-            payload = self._endpoint_data["service_history"].payload
+        service_history = self._endpoint_data.get("service_history")
+        if service_history is not None:
+            payload = service_history.payload
             if not payload:
                 return None
-            ret.extend(
-                ServiceHistory(service_history)
-                for service_history in payload.service_histories
-            )
-            return ret
+            return list(map(ServiceHistory, payload.service_histories))
 
         return None
 
@@ -471,14 +461,14 @@ class Vehicle(CustomAPIBaseModel[type[T]]):
                 ordered by date and service_category. None if not supported or unknown.
 
         """
-        if self.service_history is not None:
-            return max(
-                self.service_history, key=lambda x: (x.service_date, x.service_category)
-            )
+        history = self.service_history
+        if history is not None:
+            return max(history, key=attrgetter("service_date", "service_category"))
         return None
 
     @computed_field  # type: ignore[prop-decorator]
     @property
+    @cached_computed
     def lock_status(self) -> LockStatus | None:
         """Returns the latest lock status of Doors & Windows.
 
@@ -491,6 +481,7 @@ class Vehicle(CustomAPIBaseModel[type[T]]):
 
     @computed_field  # type: ignore[prop-decorator]
     @property
+    @cached_computed
     def last_trip(self) -> Trip | None:
         """Returns the Vehicle last trip.
 
@@ -498,14 +489,16 @@ class Vehicle(CustomAPIBaseModel[type[T]]):
             Optional[Trip]: The last trip
 
         """
+        trip_history = self._endpoint_data.get("trip_history")
         ret = None
-        if "trip_history" in self._endpoint_data:
-            ret = next(iter(self._endpoint_data["trip_history"].payload.trips), None)
+        if trip_history is not None:
+            ret = next(iter(trip_history.payload.trips), None)
 
         return None if ret is None else Trip(ret, self._metric)
 
     @computed_field  # type: ignore[prop-decorator]
     @property
+    @cached_computed
     def trip_history(self) -> list[Trip] | None:
         """Returns the Vehicle trips.
 
@@ -513,11 +506,11 @@ class Vehicle(CustomAPIBaseModel[type[T]]):
             Optional[list[Trip]]: A list of trips
 
         """
-        if "trip_history" in self._endpoint_data:
-            ret: list[Trip] = []
-            payload = self._endpoint_data["trip_history"].payload
-            ret.extend(Trip(t, self._metric) for t in payload.trips)
-            return ret
+        trip_history = self._endpoint_data.get("trip_history")
+        if trip_history is not None:
+            return list(
+                map(partial(Trip, metric=self._metric), trip_history.payload.trips)
+            )
 
         return None
 
@@ -549,6 +542,11 @@ class Vehicle(CustomAPIBaseModel[type[T]]):
 
         """
         to_date = min(to_date, date.today())  # noqa : DTZ011
+        # An empty (inverted) range can only produce an empty result; skip
+        # the round trip. Happens e.g. right after midnight when the local
+        # week/month start is still ahead of today's clamped date.
+        if from_date > to_date:
+            return []
 
         # Summary information is always returned in the first response.
         # No need to check all the following pages
@@ -558,17 +556,20 @@ class Vehicle(CustomAPIBaseModel[type[T]]):
         if resp.payload is None or len(resp.payload.summary) == 0:
             return []
 
+        # Sort chronologically once here; the generator helpers below all
+        # rely on this order instead of re-sorting individually.
+        summary = resp.payload.summary
+        summary.sort(key=attrgetter("year", "month"))
+
         # Convert to response
         if summary_type == SummaryType.DAILY:
-            return self._generate_daily_summaries(resp.payload.summary)
+            return self._generate_daily_summaries(summary)
         if summary_type == SummaryType.WEEKLY:
-            return self._generate_weekly_summaries(resp.payload.summary)
+            return self._generate_weekly_summaries(summary)
         if summary_type == SummaryType.MONTHLY:
-            return self._generate_monthly_summaries(
-                resp.payload.summary, from_date, to_date
-            )
+            return self._generate_monthly_summaries(summary, from_date, to_date)
         if summary_type == SummaryType.YEARLY:
-            return self._generate_yearly_summaries(resp.payload.summary, to_date)
+            return self._generate_yearly_summaries(summary, to_date)
         msg = "No such SummaryType"
         raise AssertionError(msg)
 
@@ -579,9 +580,10 @@ class Vehicle(CustomAPIBaseModel[type[T]]):
             Optional[Summary]: A summary or None if not supported.
 
         """
+        today = date.today()  # noqa: DTZ011
         summary = await self.get_summary(
-            from_date=Arrow.now().date(),
-            to_date=Arrow.now().date(),
+            from_date=today,
+            to_date=today,
             summary_type=SummaryType.DAILY,
         )
         min_no_of_summaries_required_for_calculation = 2
@@ -596,9 +598,10 @@ class Vehicle(CustomAPIBaseModel[type[T]]):
             Optional[Summary]: A summary or None if not supported.
 
         """
+        today = date.today()  # noqa: DTZ011
         summary = await self.get_summary(
-            from_date=Arrow.now().floor("week").date(),
-            to_date=Arrow.now().date(),
+            from_date=today - timedelta(days=today.weekday()),
+            to_date=today,
             summary_type=SummaryType.WEEKLY,
         )
         min_no_of_summaries_required_for_calculation = 2
@@ -613,9 +616,10 @@ class Vehicle(CustomAPIBaseModel[type[T]]):
             Optional[Summary]: A summary or None if not supported.
 
         """
+        today = date.today()  # noqa: DTZ011
         summary = await self.get_summary(
-            from_date=Arrow.now().floor("month").date(),
-            to_date=Arrow.now().date(),
+            from_date=today.replace(day=1),
+            to_date=today,
             summary_type=SummaryType.MONTHLY,
         )
         min_no_of_summaries_required_for_calculation = 2
@@ -630,9 +634,10 @@ class Vehicle(CustomAPIBaseModel[type[T]]):
             Optional[Summary]: A summary or None if not supported.
 
         """
+        today = date.today()  # noqa: DTZ011
         summary = await self.get_summary(
-            from_date=Arrow.now().floor("year").date(),
-            to_date=Arrow.now().date(),
+            from_date=today.replace(month=1, day=1),
+            to_date=today,
             summary_type=SummaryType.YEARLY,
         )
         min_no_of_summaries_required_for_calculation = 2
@@ -658,31 +663,94 @@ class Vehicle(CustomAPIBaseModel[type[T]]):
             Optional[list[Trip]]: A list of all trips or None if not supported.
 
         """
-        ret: list[Trip] = []
-        offset = 0
-        while True:
-            resp = await self._api.get_trips(
-                self.vin,
-                from_date,
-                to_date,
-                summary=False,
-                limit=5,
-                offset=offset,
-                route=full_route,
-            )
+        limit = 5
+        fetch = partial(
+            self._api.get_trips,
+            self.vin,
+            from_date,
+            to_date,
+            summary=False,
+            limit=limit,
+            route=full_route,
+        )
+
+        first = await fetch(offset=0)
+        if first.payload is None:
+            return []
+
+        ret: list[Trip] = [Trip(t, self._metric) for t in first.payload.trips or ()]
+
+        pagination = first.payload.metadata.pagination or {}
+        total = pagination.get("total_count")
+        if total is not None:
+            # The first response tells us every remaining page boundary, so
+            # the serial one-round-trip-per-page walk can become small
+            # concurrent batches instead.
+            offsets = range(limit, total, limit)
+            for start in range(0, len(offsets), _TRIPS_FETCH_CONCURRENCY):
+                batch = offsets[start : start + _TRIPS_FETCH_CONCURRENCY]
+                responses = await asyncio.gather(*(fetch(offset=o) for o in batch))
+                for resp in responses:
+                    if resp.payload and resp.payload.trips:
+                        ret.extend(Trip(t, self._metric) for t in resp.payload.trips)
+            return ret
+
+        # Total count missing from the response: fall back to the serial
+        # next_offset walk.
+        offset = pagination.get("next_offset")
+        while offset is not None:
+            resp = await fetch(offset=offset)
             if resp.payload is None:
                 break
-
-            # Convert to response
             if resp.payload.trips:
                 ret.extend(Trip(t, self._metric) for t in resp.payload.trips)
-
-            offset = resp.payload.metadata.pagination.next_offset
-            if offset is None:
-                break
+            offset = resp.payload.metadata.pagination.get("next_offset")
 
         return ret
 
+    async def iter_trips(
+        self,
+        from_date: date,
+        to_date: date,
+        full_route: bool = False,  # noqa : FBT001, FBT002
+    ) -> AsyncIterator[Trip]:
+        """Yield trips made between the provided dates, page by page.
+
+        Unlike :meth:`get_trips`, which materialises every page into a
+        list, pages are fetched lazily as the iterator advances: breaking
+        out early stops pagination after the current page, and only one
+        page of trips is held in memory at a time.
+
+        Args:
+            from_date (date, required): The inclusive from date
+            to_date (date, required): The inclusive to date
+            full_route (bool, optional): Provide the full route
+                                         information for each trip.
+
+        Yields:
+            Trip: The next trip in the range.
+
+        """
+        fetch = partial(
+            self._api.get_trips,
+            self.vin,
+            from_date,
+            to_date,
+            summary=False,
+            limit=5,
+            route=full_route,
+        )
+
+        offset = 0
+        while offset is not None:
+            resp = await fetch(offset=offset)
+            if resp.payload is None:
+                return
+            for t in resp.payload.trips or ():
+                yield Trip(t, self._metric)
+            pagination = resp.payload.metadata.pagination or {}
+            offset = pagination.get("next_offset")
+
     async def get_last_trip(self) -> Trip | None:
         """Return information on the last trip.
 
@@ -715,11 +783,13 @@ class Vehicle(CustomAPIBaseModel[type[T]]):
         """
         return await self._api.refresh_climate_status(self.vin)
 
-    async def post_command(self, command: CommandType, beeps: int = 0) -> StatusModel:
+    async def post_command(
+        self, command: CommandLiteral, beeps: int = 0
+    ) -> StatusModel:
         """Send remote command to the vehicle.
 
         Args:
-            command (CommandType): The remote command model
+            command (CommandLiteral): The remote command to send
             beeps (int): Amount of beeps for commands that support it
 
         Returns:
@@ -767,86 +837,64 @@ class Vehicle(CustomAPIBaseModel[type[T]]):
 
     def _dump_all(self) -> dict[str, Any]:
         """Dump data from all endpoints for debugging and further work."""
-        dump: [str, Any] = {
-            "vehicle_info": json.loads(self._vehicle_info.model_dump_json())
+        # mode="json" yields the JSON-compatible dicts directly, without the
+        # old serialize-to-string-and-reparse round trip. The dicts are
+        # freshly built per call and censor_all copies rather than mutates,
+        # so no deepcopy is needed before censoring.
+        dump: dict[str, Any] = {
+            "vehicle_info": self._vehicle_info.model_dump(mode="json")
         }
         for name, data in self._endpoint_data.items():
-            dump[name] = json.loads(data.model_dump_json())
+            dump[name] = data.model_dump(mode="json")
 
-        return censor_all(copy.deepcopy(dump))
+        return censor_all(dump)
 
     def _generate_daily_summaries(
         self, summary: list[_SummaryItemModel]
     ) -> list[Summary]:
-        summary.sort(key=attrgetter("year", "month"))
+        # Caller (get_summary) has sorted by year/month; ordering the days
+        # within each month in place avoids a sorted() copy per month.
+        for month in summary:
+            month.histograms.sort(key=attrgetter("day"))
         # Skip histograms with summary=None - a hollow Summary crashes
-        # downstream when sensors read its properties (see #278).
+        # downstream when sensors read its properties (see #278). One plain
+        # date per histogram instead of two Arrow wrappers.
         return [
-            Summary(
-                histogram.summary,
-                self._metric,
-                Arrow(histogram.year, histogram.month, histogram.day).date(),
-                Arrow(histogram.year, histogram.month, histogram.day).date(),
-                histogram.hdc,
-            )
+            Summary(histogram.summary, self._metric, day, day, histogram.hdc)
             for month in summary
-            for histogram in sorted(month.histograms, key=attrgetter("day"))
+            for histogram in month.histograms
             if histogram.summary is not None
+            for day in (date(histogram.year, histogram.month, histogram.day),)
         ]
 
     def _generate_weekly_summaries(
         self, summary: list[_SummaryItemModel]
     ) -> list[Summary]:
-        ret: list[Summary] = []
-        summary.sort(key=attrgetter("year", "month"))
-
-        # Flatten the list of histograms
-        histograms = [histogram for month in summary for histogram in month.histograms]
-        histograms.sort(key=lambda h: date(day=h.day, month=h.month, year=h.year))
-
-        # Group histograms by week
-        for _, week_histograms_iter in groupby(
-            histograms, key=lambda h: Arrow(h.year, h.month, h.day).span("week")[0]
-        ):
-            week_histograms = list(week_histograms_iter)
-            build_hdc = copy.copy(week_histograms[0].hdc)
-            build_summary = copy.copy(week_histograms[0].summary)
-            start_date = Arrow(
-                week_histograms[0].year,
-                week_histograms[0].month,
-                week_histograms[0].day,
-            )
+        # Single pass bucketing by ISO week: the old sort + flatten + groupby
+        # walked the histograms three times and built two Arrow objects per
+        # histogram just to find the week span; isocalendar() gives the same
+        # key straight from a plain date.
+        buckets: dict[tuple[int, int], list[tuple[date, _HistogramModel]]] = {}
+        for month in summary:
+            for histogram in month.histograms:
+                day = date(histogram.year, histogram.month, histogram.day)
+                buckets.setdefault(day.isocalendar()[:2], []).append((day, histogram))
 
-            for histogram in week_histograms[1:]:
-                # ``add_with_none`` returns the sum, so we must capture it;
-                # without the assignment ``build_hdc`` would stay at the
-                # first histogram's hdc (or ``None`` if that was None).
-                build_hdc = add_with_none(build_hdc, histogram.hdc)
-                # histogram.summary (and the seed build_summary) may be None on
-                # days where the Toyota API returned a partial payload. Seed with
-                # the first non-None summary we see, then accumulate.
-                if histogram.summary is None:
-                    continue
-                if build_summary is None:
-                    build_summary = copy.copy(histogram.summary)
-                else:
-                    build_summary += histogram.summary
-
-            end_date = Arrow(
-                week_histograms[-1].year,
-                week_histograms[-1].month,
-                week_histograms[-1].day,
-            )
+        ret: list[Summary] = []
+        for _, items in sorted(buckets.items()):
+            items.sort()
+            build_summary = _SummaryBaseModel.aggregate([h.summary for _, h in items])
             # Skip weeks where every histogram.summary was None - a hollow
             # Summary crashes downstream when sensors read its properties.
             if build_summary is None:
                 continue
+            build_hdc = _HDCModel.aggregate([h.hdc for _, h in items])
             ret.append(
                 Summary(
                     build_summary,
                     self._metric,
-                    start_date.date(),
-                    end_date.date(),
+                    items[0][0],
+                    items[-1][0],
                     build_hdc,
                 )
             )
@@ -856,9 +904,9 @@ class Vehicle(CustomAPIBaseModel[type[T]]):
     def _generate_monthly_summaries(
         self, summary: list[_SummaryItemModel], from_date: date, to_date: date
     ) -> list[Summary]:
-        # Convert all the monthly responses from the payload to a summary response
+        # Convert all the monthly responses from the payload to a summary
+        # response; get_summary has already sorted by year/month.
         ret: list[Summary] = []
-        summary.sort(key=attrgetter("year", "month"))
         for month in summary:
             # Skip months with summary=None - a hollow Summary crashes
             # downstream when sensors read its properties (see #278).
@@ -886,54 +934,27 @@ class Vehicle(CustomAPIBaseModel[type[T]]):
     def _generate_yearly_summaries(
         self, summary: list[_SummaryItemModel], to_date: date
     ) -> list[Summary]:
-        summary.sort(key=attrgetter("year", "month"))
+        # Bucket months by year and aggregate each bucket in one pass, like
+        # the weekly generator: the old incremental fold seeded its
+        # accumulators with copy.copy (which on pydantic models goes through
+        # the generic copy protocol) and built an intermediate model per
+        # added month. get_summary has already sorted by year/month.
         ret: list[Summary] = []
-        build_hdc = copy.copy(summary[0].hdc)
-        build_summary = copy.copy(summary[0].summary)
-        start_date = date(day=1, month=summary[0].month, year=summary[0].year)
-
-        if len(summary) == 1:
-            if build_summary is not None:
-                ret.append(
-                    Summary(build_summary, self._metric, start_date, to_date, build_hdc)
-                )
-        else:
-            for month, next_month in zip(
-                summary[1:], [*summary[2:], None], strict=False
-            ):
-                summary_month = date(day=1, month=month.month, year=month.year)
-                # ``add_with_none`` returns the sum; capture it or ``build_hdc``
-                # stays at the year's first month's hdc.
-                build_hdc = add_with_none(build_hdc, month.hdc)
-                # month.summary (and the seed build_summary) may be None when
-                # the Toyota API returned partial data.
-                if month.summary is not None:
-                    if build_summary is None:
-                        build_summary = copy.copy(month.summary)
-                    else:
-                        build_summary += month.summary
-
-                if next_month is None or next_month.year != month.year:
-                    end_date = min(
-                        to_date, date(day=31, month=12, year=summary_month.year)
-                    )
-                    # Skip years where every month.summary was None - a hollow
-                    # Summary crashes downstream when sensors read its properties.
-                    if build_summary is not None:
-                        ret.append(
-                            Summary(
-                                build_summary,
-                                self._metric,
-                                start_date,
-                                end_date,
-                                build_hdc,
-                            )
-                        )
-                    if next_month:
-                        start_date = date(
-                            day=1, month=next_month.month, year=next_month.year
-                        )
-                        build_hdc = copy.copy(next_month.hdc)
-                        build_summary = copy.copy(next_month.summary)
+        buckets: dict[int, list[_SummaryItemModel]] = {}
+        for month in summary:
+            buckets.setdefault(month.year, []).append(month)
+
+        for year, months in buckets.items():
+            build_summary = _SummaryBaseModel.aggregate([m.summary for m in months])
+            # Skip years where every month.summary was None - a hollow
+            # Summary crashes downstream when sensors read its properties.
+            if build_summary is None:
+                continue
+            build_hdc = _HDCModel.aggregate([m.hdc for m in months])
+            start_date = date(day=1, month=months[0].month, year=year)
+            end_date = min(to_date, date(day=31, month=12, year=year))
+            ret.append(
+                Summary(build_summary, self._metric, start_date, end_date, build_hdc)
+            )
 
         return ret
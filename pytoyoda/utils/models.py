@@ -1,9 +1,23 @@
 """Utilities for manipulating or extending pydantic models."""
 
 from collections.abc import Callable
-from typing import Annotated, Any, Generic, TypeVar, get_args, get_origin
-
-from pydantic import BaseModel, ConfigDict, ValidationError, WrapValidator
+from dataclasses import is_dataclass
+from datetime import date, datetime
+from functools import lru_cache, wraps
+from types import UnionType
+from typing import Annotated, Any, Generic, TypeVar, Union, get_args, get_origin
+from uuid import UUID
+
+from pydantic import (
+    BaseModel,
+    BeforeValidator,
+    ConfigDict,
+    TypeAdapter,
+    ValidationError,
+    WrapValidator,
+)
+from pydantic.alias_generators import to_camel
+from typing_extensions import is_typeddict
 
 T = TypeVar("T")
 
@@ -25,6 +39,79 @@ def invalid_to_none(v: Any, handler: Callable[[Any], Any]) -> Any:  # noqa : ANN
         return None
 
 
+@lru_cache(maxsize=256)
+def _parse_iso(s: str) -> datetime:
+    """Parse one ISO-8601 string, memoized.
+
+    Payloads repeat timestamps heavily (a page of notifications shares the
+    same dates), so identical strings become dict hits instead of re-parses.
+    datetimes are immutable, making the shared result safe.
+    """
+    return datetime.fromisoformat(s)
+
+
+def parse_datetime_fast(v: Any) -> Any:  # noqa : ANN401
+    """Parse ISO-8601 strings with the C-level fromisoformat fast path.
+
+    The Toyota API always emits ISO-8601 timestamps, so a before-validator
+    can hand them to ``datetime.fromisoformat`` directly instead of going
+    through pydantic's speculative multi-format datetime parsing. Anything
+    that is not a parseable string is returned unchanged for the regular
+    validator to handle.
+
+    Args:
+        v: Raw field value from the API
+
+    Returns:
+        Parsed datetime, or the original value if not an ISO string
+
+    """
+    if isinstance(v, str):
+        try:
+            return _parse_iso(v)
+        except ValueError:
+            return v
+    return v
+
+
+# Reusable annotated datetime for API timestamp fields: the before-validator
+# tries the C-coded fromisoformat first so pydantic's slower multi-format
+# datetime parser only runs for values that are not plain ISO strings.
+ApiDatetime = Annotated[datetime, BeforeValidator(parse_datetime_fast)]
+
+
+def cached_computed(func: Callable[[Any], T]) -> Callable[[Any], T]:
+    """Memoize a computed-field property on the model instance.
+
+    Pydantic's ``@computed_field`` re-runs the property on every attribute
+    access and on every serialization. For properties whose inputs are
+    immutable for the life of the instance this wrapper stores the first
+    result in a lazily-created ``_computed_cache`` dict and returns it on
+    subsequent calls.
+
+    Args:
+        func: Property getter to memoize
+
+    Returns:
+        Memoizing wrapper around the getter
+
+    """
+    key = func.__name__
+
+    @wraps(func)
+    def wrapper(self: Any) -> T:  # noqa : ANN401
+        try:
+            cache = self._computed_cache
+        except AttributeError:
+            cache = {}
+            self._computed_cache = cache
+        if key not in cache:
+            cache[key] = func(self)
+        return cache[key]
+
+    return wrapper
+
+
 class CustomEndpointBaseModel(BaseModel):
     """Enhanced BaseModel that automatically sets invalid values to None.
 
@@ -43,6 +130,95 @@ class CustomEndpointBaseModel(BaseModel):
 
     """
 
+    # Tight config so pydantic-core picks its validator fast paths: unknown
+    # payload keys are dropped without per-key checks, aliases keep working
+    # alongside field names, and the default=None/default=0 values wired
+    # into nearly every Field are not re-validated. The camelCase wire names
+    # come from the alias generator, so subclasses only spell out an alias
+    # when it deviates from that rule. defer_build pushes the pydantic-core
+    # schema build for the ~60 endpoint models from import time to first
+    # use, which matters for CLI and Home Assistant startup. Not frozen at
+    # this level: command models (climate, charging) are built up by
+    # callers. Read-only subclasses (summary/HDC aggregation, status)
+    # opt into frozen=True in their own model_config.
+    model_config = ConfigDict(
+        extra="ignore",
+        populate_by_name=True,
+        validate_default=False,
+        alias_generator=to_camel,
+        defer_build=True,
+    )
+
+    @classmethod
+    def from_trusted(cls, data: dict[str, Any]) -> "CustomEndpointBaseModel":
+        """Construct from an already-validated payload without re-validating.
+
+        For server-issued data known to conform (e.g. responses recorded
+        and replayed, or re-parsing in a long-polling loop) this walks a
+        precomputed per-class plan and calls ``model_construct`` for each
+        nested model, skipping coercion, constraint checks and the
+        invalid-to-none wrapper entirely. datetime/date/UUID strings are
+        still converted since JSON cannot carry them natively.
+
+        The default parse path stays ``model_validate``/``validate_json``;
+        only call this when the payload is trusted.
+
+        Args:
+            data: Payload dict keyed by wire (alias) or field names
+
+        Returns:
+            Constructed model instance
+
+        """
+        plan = _TRUSTED_PLANS.get(cls)
+        if plan is None:
+            plan = _TRUSTED_PLANS[cls] = _build_trusted_plan(cls)
+
+        values: dict[str, Any] = {}
+        for name, key, pre, conv, container in plan:
+            if key in data:
+                v = data[key]
+            elif name in data:
+                v = data[name]
+            else:
+                continue
+            if v is not None and pre:
+                # Whole-value before-validators (Annotated metadata and
+                # mode="before" field validators), in declaration order.
+                for func in pre:
+                    v = func(v)
+            if v is not None and conv is not None:
+                if container is list:
+                    v = [conv(item) for item in v]
+                elif container is tuple:
+                    v = tuple(conv(item) for item in v)
+                else:
+                    v = conv(v)
+            values[name] = v
+        return cls.model_construct(**values)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Dump to a dict with None-valued fields filtered in Rust.
+
+        ``exclude_none`` lets pydantic-core skip the optional-handling logic
+        per field, which is cheaper than a Python-side
+        ``{k: v for k, v in ... if v is not None}`` pass over the result.
+
+        Returns:
+            Field-name-keyed dict without None values
+
+        """
+        return self.model_dump(mode="python", exclude_none=True, by_alias=False)
+
+    def to_json(self) -> str:
+        """Serialize to a JSON string in wire (camelCase) form.
+
+        Returns:
+            JSON string with aliases applied and None fields dropped
+
+        """
+        return self.model_dump_json(by_alias=True, exclude_none=True)
+
     def __init_subclass__(cls, **kwargs: dict) -> None:
         """Automatically add validation wrapper to all fields of subclasses.
 
@@ -64,6 +240,109 @@ class CustomEndpointBaseModel(BaseModel):
                 cls.__annotations__[name] = Annotated[annotation, validator]
 
 
+# Per-class construction plans for from_trusted: (field name, wire key,
+# whole-value before-validators, per-item converter or None, list/tuple
+# container or None) per field.
+_TRUSTED_PLANS: dict[type, list[tuple[str, str, Any, Any, Any]]] = {}
+
+
+@lru_cache(maxsize=64)
+def _type_adapter(tp: Any) -> TypeAdapter:  # noqa : ANN401
+    """Shared adapter so leaf types parse on pydantic-core's Rust path.
+
+    Built lazily and cached per type: TypeAdapter construction is not free
+    and most processes never touch the trusted path.
+    """
+    return TypeAdapter(tp)
+
+
+def _trusted_converter(ann: Any) -> Any:  # noqa : ANN401
+    """Return the converter from_trusted needs for one unwrapped annotation."""
+    if isinstance(ann, type) and issubclass(ann, CustomEndpointBaseModel):
+        return lambda v: ann.from_trusted(v) if isinstance(v, dict) else v
+    if ann is datetime:
+        return parse_datetime_fast
+    if ann is date:
+        return lambda v: date.fromisoformat(v) if isinstance(v, str) else v
+    if ann is UUID:
+        return lambda v: (
+            _type_adapter(UUID).validate_python(v) if isinstance(v, str) else v
+        )
+    if is_dataclass(ann) or is_typeddict(ann):
+        # Dataclass leaves such as ChargeTime and TypedDicts such as the
+        # trips pagination: the cached adapter applies their constraints
+        # and alias mapping in Rust.
+        return lambda v: (
+            _type_adapter(ann).validate_python(v) if isinstance(v, dict) else v
+        )
+    return None
+
+
+def _build_trusted_plan(
+    cls: type[CustomEndpointBaseModel],
+) -> list[tuple[str, str, Any, Any, Any]]:
+    """Build the from_trusted field plan for a model class."""
+    # mode="before" field validators declared on the class (e.g.
+    # ChargingSchedule._pack_days) must run on the raw value exactly as
+    # they would during model_validate.
+    decorators = cls.__pydantic_decorators__.field_validators.values()
+
+    plan = []
+    for name, field in cls.model_fields.items():
+        pre = [
+            getattr(cls, dec.cls_var_name)
+            for dec in decorators
+            if dec.info.mode == "before" and name in dec.info.fields
+        ]
+        # Top-level Annotated metadata is split off into field.metadata by
+        # pydantic; pick up its before-validators too.
+        pre.extend(
+            meta.func for meta in field.metadata if isinstance(meta, BeforeValidator)
+        )
+
+        ann = field.annotation
+        container = None
+        # Unwrap Optional/union, Annotated and one level of list/tuple
+        # container; before-validators found outside a container apply to
+        # the whole value, ones found inside apply per item.
+        item_pre: list[Any] = []
+        for _ in range(4):
+            origin = get_origin(ann)
+            if origin in (Union, UnionType):
+                args = [a for a in get_args(ann) if a is not type(None)]
+                ann = args[0] if args else None
+            elif origin is Annotated:
+                target = item_pre if container else pre
+                target.extend(
+                    meta.func
+                    for meta in ann.__metadata__
+                    if isinstance(meta, BeforeValidator)
+                )
+                ann = get_args(ann)[0]
+            elif origin in (list, tuple):
+                container = origin
+                ann = get_args(ann)[0]
+            else:
+                break
+
+        conv = _trusted_converter(ann)
+        if item_pre:
+            conv = _chain_converters(item_pre, conv)
+        plan.append((name, field.alias or name, pre, conv, container))
+    return plan
+
+
+def _chain_converters(pre: list[Any], conv: Any) -> Any:  # noqa : ANN401
+    """Compose per-item before-validators with a leaf converter."""
+
+    def chained(v: Any) -> Any:  # noqa : ANN401
+        for func in pre:
+            v = func(v)
+        return conv(v) if conv is not None and v is not None else v
+
+    return chained
+
+
 class CustomAPIBaseModel(BaseModel, Generic[T]):
     """Base class for all API models."""
 
@@ -99,7 +99,7 @@ async def run() -> None:
 
     # Similarly patch the auth flow's client.post / client.get to save the
     # authenticate / authorize / access_token responses. These bypass
-    # request_raw because they go through the hishel AsyncCacheClient directly.
+    # request_raw because they go through the shared httpx client directly.
     import httpx
     original_request = httpx.AsyncClient.request
 
@@ -0,0 +1,43 @@
+"""Tests for the Controller request helpers."""
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from pytoyoda.controller import Controller
+
+
+@pytest.mark.asyncio
+async def test_request_json_many_runs_concurrently_and_preserves_order():
+    """Responses come back in spec order even when later requests finish first."""
+    completed: list[str] = []
+
+    async def fake_request_json(**kwargs: Any) -> dict[str, Any]:
+        endpoint = kwargs["endpoint"]
+        # The first spec sleeps longest so completion order is reversed;
+        # sequential execution would complete the specs in order instead.
+        await asyncio.sleep({"/a": 0.03, "/b": 0.02, "/c": 0.01}[endpoint])
+        completed.append(endpoint)
+        return {"endpoint": endpoint}
+
+    controller = Controller.__new__(Controller)
+    controller.request_json = fake_request_json  # type: ignore[method-assign]
+
+    specs = [
+        {"method": "GET", "endpoint": "/a"},
+        {"method": "GET", "endpoint": "/b"},
+        {"method": "GET", "endpoint": "/c"},
+    ]
+    results = await controller.request_json_many(specs)
+
+    assert results == [{"endpoint": "/a"}, {"endpoint": "/b"}, {"endpoint": "/c"}]
+    assert completed == ["/c", "/b", "/a"]
+
+
+@pytest.mark.asyncio
+async def test_request_json_many_empty_batch():
+    """An empty batch resolves to an empty list without touching the client."""
+    controller = Controller.__new__(Controller)
+
+    assert await controller.request_json_many([]) == []
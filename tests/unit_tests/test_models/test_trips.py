@@ -2,7 +2,13 @@
 
 from __future__ import annotations
 
-from pytoyoda.models.endpoints.trips import _SummaryBaseModel
+import math
+
+from pytoyoda.models.endpoints.trips import (
+    RouteArray,
+    _SummaryBaseModel,
+    _SummaryModel,
+)
 
 
 def test_summary_base_model_parses_partial_payload() -> None:
@@ -116,3 +122,100 @@ def test_summary_base_model_add_does_not_mutate_operands() -> None:
     assert full.duration == full_snapshot.duration
     assert sparse.length == sparse_snapshot.length
     assert sparse.duration == sparse_snapshot.duration
+
+
+def test_summary_model_add_preserves_subclass_fields() -> None:
+    """Adding two ``_SummaryModel`` instances must keep the start/end fields.
+
+    ``aggregate`` only folds the base-class numeric fields; subclass-only
+    fields (coordinates, timestamps, night_trip) must be carried over from
+    the first operand instead of vanishing from the constructed result.
+    """
+    a = _SummaryModel.model_validate(
+        {
+            "length": 100,
+            "duration": 60,
+            "startLat": 50.1,
+            "startLon": 8.6,
+            "startTs": "2024-03-01T08:00:00+00:00",
+            "endLat": 50.2,
+            "endLon": 8.7,
+            "endTs": "2024-03-01T09:00:00+00:00",
+            "nightTrip": False,
+        }
+    )
+    b = _SummaryModel.model_validate(
+        {
+            "length": 50,
+            "duration": 30,
+            "startLat": 51.0,
+            "startLon": 9.0,
+            "startTs": "2024-03-02T08:00:00+00:00",
+            "endLat": 51.1,
+            "endLon": 9.1,
+            "endTs": "2024-03-02T09:00:00+00:00",
+            "nightTrip": True,
+        }
+    )
+
+    result = a + b
+
+    assert isinstance(result, _SummaryModel)
+    assert result.length == 150
+    assert result.duration == 90
+    # Non-accumulated fields come from the first operand.
+    assert result.start_lat == 50.1
+    assert result.start_lon == 8.6
+    assert result.start_ts == a.start_ts
+    assert result.end_lat == 50.2
+    assert result.night_trip is False
+
+
+def test_route_array_preserves_missing_values_and_negative_ints() -> None:
+    """Null coordinates and legitimate -1 ints must survive the columns.
+
+    Regression: missing lat/lon used to quantize to 0.0 (a real location on
+    the equator/prime meridian) and -1 doubled as the int-None sentinel, so
+    a stored mode=-1 read back as None.
+    """
+    points = [
+        {
+            "lat": 50.1234567,
+            "lon": 8.6543217,
+            "overspeed": True,
+            "highway": None,
+            "isEv": False,
+            "indexInPoints": 0,
+            "mode": -1,
+        },
+        {
+            "lat": None,
+            "lon": None,
+            "overspeed": None,
+            "highway": False,
+            "isEv": True,
+            "indexInPoints": None,
+            "mode": 3,
+        },
+    ]
+
+    route = RouteArray(points)
+
+    first, second = route[0], route[1]
+    # Slicing materialises models like the old list-based route did.
+    assert route[0:2] == [first, second]
+    assert first.lat == 50.1234567
+    assert first.mode == -1
+    assert first.index_in_points == 0
+    assert second.lat is None
+    assert second.lon is None
+    assert second.index_in_points is None
+    assert second.mode == 3
+    # Bulk columns surface missing coordinates as nan, not 0.0.
+    assert math.isnan(route.lat[1])
+    assert math.isnan(route.lon[1])
+    # Serialize -> re-validate must be lossless, including field-name keys.
+    rebuilt = RouteArray(RouteArray._serialize(route))
+    assert rebuilt == route
+    assert rebuilt[0].is_ev is False
+    assert rebuilt[1].is_ev is True
@@ -0,0 +1,87 @@
+"""Tests for Vehicle trip pagination."""
+
+from datetime import date
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from pytoyoda.models.endpoints.trips import TripsResponseModel
+from pytoyoda.models.trips import Trip
+from pytoyoda.models.vehicle import Vehicle
+
+VIN = "Random0815"
+
+
+def _page(trip_count: int, next_offset: int | None) -> TripsResponseModel:
+    """Build a one-page trips response with the given pagination."""
+    return TripsResponseModel.model_validate(
+        {
+            "status": {"messages": []},
+            "payload": {
+                "from": "2024-03-01",
+                "to": "2024-03-31",
+                "trips": [
+                    {"id": str(uuid4()), "category": 1, "summary": None}
+                    for _ in range(trip_count)
+                ],
+                "_metadata": {
+                    "sortedBy": [],
+                    "pagination": {
+                        "limit": 5,
+                        "offset": 0,
+                        "nextOffset": next_offset,
+                        "currentPage": 1,
+                        "totalCount": trip_count,
+                        "pageCount": 1,
+                    },
+                },
+            },
+        }
+    )
+
+
+def _vehicle(api: AsyncMock) -> Vehicle:
+    # Build a minimal Vehicle without going through the full bootstrap;
+    # iter_trips only needs the api handle, the VIN and the unit flag.
+    vehicle = Vehicle.__new__(Vehicle)
+    vehicle._api = api  # noqa: SLF001
+    vehicle._vehicle_info = type("_Stub", (), {"vin": VIN})()  # noqa: SLF001
+    vehicle._metric = True  # noqa: SLF001
+    return vehicle
+
+
+@pytest.mark.asyncio
+async def test_iter_trips_follows_pagination_across_pages():
+    """All pages are fetched lazily and every trip is yielded in order."""
+    api = AsyncMock()
+    api.get_trips.side_effect = [_page(5, next_offset=5), _page(2, next_offset=None)]
+    vehicle = _vehicle(api)
+
+    trips = [
+        t
+        async for t in vehicle.iter_trips(date(2024, 3, 1), date(2024, 3, 31))
+    ]
+
+    assert len(trips) == 7
+    assert all(isinstance(t, Trip) for t in trips)
+    assert api.get_trips.call_count == 2
+    offsets = [call.kwargs["offset"] for call in api.get_trips.call_args_list]
+    assert offsets == [0, 5]
+
+
+@pytest.mark.asyncio
+async def test_iter_trips_break_stops_pagination():
+    """Breaking out of the iterator must not fetch the remaining pages."""
+    api = AsyncMock()
+    api.get_trips.side_effect = [_page(5, next_offset=5), _page(5, next_offset=None)]
+    vehicle = _vehicle(api)
+
+    seen = 0
+    async for _ in vehicle.iter_trips(date(2024, 3, 1), date(2024, 3, 31)):
+        seen += 1
+        if seen == 2:
+            break
+
+    assert seen == 2
+    assert api.get_trips.call_count == 1
@@ -7,6 +7,8 @@ discovery on 2026-04-24 and Track B design (Addendum 4 of the remediation plan).
 
 from __future__ import annotations
 
+import json
+from types import SimpleNamespace
 from unittest.mock import AsyncMock
 
 import pytest
@@ -19,6 +21,11 @@ VIN = "Random0815"
 GUID = "123e4567-e89b-12d3-a456-426614174000"
 
 
+def _json_response(data: dict) -> SimpleNamespace:
+    """Mimic an httpx.Response carrying a JSON body."""
+    return SimpleNamespace(content=json.dumps(data).encode())
+
+
 @pytest.mark.asyncio
 async def test_refresh_vehicle_status_sends_correct_body_and_endpoint():
     """The POST must hit /refresh-status with the four-field body shape that
@@ -26,14 +33,16 @@ async def test_refresh_vehicle_status_sends_correct_body_and_endpoint():
     the gateway returns 500 (the trap PR #302 fell into)."""
     controller = AsyncMock()
     controller._uuid = GUID
-    controller.request_json.return_value = {"status": {"messages": []}, "payload": {}}
+    controller.request_raw.return_value = _json_response(
+        {"status": {"messages": []}, "payload": {}}
+    )
 
     api = Api(controller)
 
     await api.refresh_vehicle_status(VIN)
 
-    controller.request_json.assert_called_once()
-    kwargs = controller.request_json.call_args.kwargs
+    controller.request_raw.assert_called_once()
+    kwargs = controller.request_raw.call_args.kwargs
     assert kwargs["method"] == "POST"
     assert kwargs["endpoint"] == VEHICLE_GLOBAL_REMOTE_REFRESH_STATUS_ENDPOINT
     assert kwargs["vin"] == VIN
@@ -52,10 +61,9 @@ async def test_refresh_vehicle_status_parses_response_with_return_code():
     parsed model (snake_case via Pydantic Field alias)."""
     controller = AsyncMock()
     controller._uuid = GUID
-    controller.request_json.return_value = {
-        "status": {"messages": []},
-        "payload": {"returnCode": "000000"},
-    }
+    controller.request_raw.return_value = _json_response(
+        {"status": {"messages": []}, "payload": {"returnCode": "000000"}}
+    )
 
     api = Api(controller)
     result = await api.refresh_vehicle_status(VIN)
@@ -71,10 +79,9 @@ async def test_refresh_vehicle_status_handles_layer1_failure_payload():
     a regular response - the caller decides what to do with it."""
     controller = AsyncMock()
     controller._uuid = GUID
-    controller.request_json.return_value = {
-        "status": {"messages": []},
-        "payload": {"returnCode": "010001"},
-    }
+    controller.request_raw.return_value = _json_response(
+        {"status": {"messages": []}, "payload": {"returnCode": "010001"}}
+    )
 
     api = Api(controller)
     result = await api.refresh_vehicle_status(VIN)
@@ -0,0 +1,98 @@
+"""Tests for the pydantic model utilities."""
+
+import json
+from datetime import datetime
+from pathlib import Path
+from uuid import UUID
+
+from pytoyoda.models.endpoints.electric import ChargeTime, ElectricResponseModel
+from pytoyoda.models.endpoints.trips import TripsResponseModel
+
+DATA_FOLDER = Path(__file__).parent.parent / "data"
+
+
+def test_to_dict_drops_none_and_keeps_field_names():
+    """to_dict filters None-valued fields and keys by snake_case field name."""
+    raw = json.loads((DATA_FOLDER / "v1_trips.json").read_text())
+    summary = TripsResponseModel.model_validate(raw).payload.trips[0].summary
+
+    dumped = summary.to_dict()
+
+    assert "start_ts" in dumped
+    assert all(v is not None for v in dumped.values())
+    assert dumped == {
+        k: v
+        for k, v in summary.model_dump(mode="python", by_alias=False).items()
+        if v is not None
+    }
+
+
+def test_to_json_emits_wire_aliases_without_none():
+    """to_json serializes in camelCase wire form with None fields dropped."""
+    raw = json.loads((DATA_FOLDER / "v1_trips.json").read_text())
+    summary = TripsResponseModel.model_validate(raw).payload.trips[0].summary
+
+    wire = json.loads(summary.to_json())
+
+    assert "startTs" in wire
+    assert "start_ts" not in wire
+    assert None not in wire.values()
+
+
+def test_from_trusted_matches_model_validate_on_trips_payload():  # noqa: D103
+    raw = json.loads((DATA_FOLDER / "v1_trips.json").read_text())
+
+    trusted = TripsResponseModel.from_trusted(raw)
+    validated = TripsResponseModel.model_validate(raw)
+
+    trip_t = trusted.payload.trips[0]
+    trip_v = validated.payload.trips[0]
+    # Leaf conversions JSON cannot carry natively must still happen.
+    assert isinstance(trip_t.id, UUID)
+    assert trip_t.id == trip_v.id
+    assert isinstance(trip_t.summary.start_ts, datetime)
+    assert trip_t.summary.start_ts == trip_v.summary.start_ts
+    # Nested models come back as models, not dicts.
+    assert type(trip_t.summary) is type(trip_v.summary)
+    assert trusted.payload.metadata.pagination == validated.payload.metadata.pagination
+
+
+def test_from_trusted_applies_before_validators_and_dataclasses():
+    """Annotated/before-validator fields must convert like model_validate.
+
+    ``lastUpdateTimestamp`` is an ``ApiDatetime`` (Annotated BeforeValidator),
+    ``days`` relies on a mode="before" field validator packing a dict into a
+    bitmask, and ``startTime`` is a pydantic dataclass leaf.
+    """
+    payload = {
+        "status": "SUCCESS",
+        "payload": {
+            "batteryLevel": 80.0,
+            "lastUpdateTimestamp": "2024-03-01T08:00:00+00:00",
+            "chargingSchedules": [
+                {
+                    "id": 1,
+                    "enabled": True,
+                    "type": "startEnd",
+                    "startTime": {"hour": 22, "minute": 30},
+                    "endTime": {"hour": 6, "minute": 0},
+                    "days": {"mon": True, "sun": True},
+                }
+            ],
+        },
+    }
+
+    trusted = ElectricResponseModel.from_trusted(payload).payload
+    validated = ElectricResponseModel.model_validate(payload).payload
+
+    assert isinstance(trusted.last_update_timestamp, datetime)
+    assert trusted.last_update_timestamp == validated.last_update_timestamp
+
+    schedule = trusted.charging_schedules[0]
+    assert schedule == validated.charging_schedules[0]
+    assert schedule.days == 65  # Monday (bit 0) + Sunday (bit 6)
+    assert isinstance(schedule.start_time, ChargeTime)
+    # The packed bitmask must be usable downstream (rotation arithmetic).
+    window = trusted.next_global_window(ref=datetime(2024, 3, 1, 12, 0))
+    assert window is not None
+    assert window.start == datetime(2024, 3, 3, 22, 30)